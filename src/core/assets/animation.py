@@ -2,6 +2,8 @@ import pygame
 
 class Animation:
     def __init__(self, images, frame_delay=10, image_paths=None):
+        self._clock = None  # AnimationSystem driving this animation's frames, if any
+        self._slot = None
         self.images = images
         self.current_frame = 0
         self.frame_delay = frame_delay
@@ -11,6 +13,47 @@ class Animation:
         self.dirty = True  # Mark as needing redraw when frame changes
         self.from_spritesheet = len(image_paths) == 1 if image_paths else False
         
+    def bind_clock(self, clock, slot):
+        """Hand frame timing over to an AnimationSystem slot"""
+        self._clock = clock
+        self._slot = slot
+        
+    def unbind_clock(self):
+        """Take frame timing back from the AnimationSystem, keeping the current frame"""
+        if self._clock is None:
+            return
+        current_frame, frame_counter = self.current_frame, self.frame_counter
+        self._clock = None
+        self._slot = None
+        self.current_frame = current_frame
+        self.frame_counter = frame_counter
+        
+    @property
+    def current_frame(self):
+        if self._clock is None:
+            return self._current_frame
+        return int(self._clock.current_frame[self._slot])
+    
+    @current_frame.setter
+    def current_frame(self, value):
+        if self._clock is None:
+            self._current_frame = value
+        else:
+            self._clock.current_frame[self._slot] = value
+            
+    @property
+    def frame_counter(self):
+        if self._clock is None:
+            return self._frame_counter
+        return int(self._clock.frame_counter[self._slot])
+    
+    @frame_counter.setter
+    def frame_counter(self, value):
+        if self._clock is None:
+            self._frame_counter = value
+        else:
+            self._clock.frame_counter[self._slot] = value
+        
     def set_position(self, x, y):
         old_pos = (self.rect.x, self.rect.y)
         self.rect.x = x
@@ -21,6 +64,10 @@ class Animation:
             self.dirty = True
         
     def update(self):
+        # Frames are advanced by the AnimationSystem once one is driving this animation
+        if self._clock is not None:
+            return
+            
         self.frame_counter += 1
         if self.frame_counter >= self.frame_delay:
             self.frame_counter = 0
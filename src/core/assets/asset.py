@@ -3,8 +3,9 @@ import pygame
 class Asset:
     visible: bool = True
     
-    def __init__(self, image):
+    def __init__(self, image, source_path=None):
         self.image = image
+        self.source_path = source_path  # Original image path, used when rescaling
         self.rect = self.image.get_rect()
         self.dirty = True  # Mark as needing redraw initially
     
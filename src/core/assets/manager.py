@@ -1,6 +1,6 @@
 import os
 import pygame
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple, Set
 from .animation import Animation
 from .asset import Asset
 from constants import EntityType, asset_map, additional_assets
@@ -20,6 +20,7 @@ class AssetManager:
         self.images: Dict[str, pygame.Surface] = {}
         self.animations: Dict[str, Animation] = {}
         self.assets: Dict[str, Asset] = {}
+        self.opaque_images: Set[pygame.Surface] = set()  # Loaded images with no transparent pixels
     
     def get_image(self, path: str) -> pygame.Surface:
         """Load image and cache it, or return from cache if already loaded"""
@@ -29,6 +30,7 @@ class AssetManager:
                 self.images[path] = pygame.image.load(path)
             except (FileNotFoundError, pygame.error):
                 self.images[path] = self._create_placeholder(50, 50)
+            self._register_opacity(self.images[path])
         return self.images[path]
     
     def get_animation(self, paths: List[str], frame_delay=10) -> Animation:
@@ -43,7 +45,7 @@ class AssetManager:
         """Get asset from cache or create a new one"""
         if path not in self.assets:
             image = self.get_image(path)
-            asset = Asset(image)
+            asset = Asset(image, source_path=path)
             self.assets[path] = asset
         return self.assets[path]
     
@@ -54,7 +56,24 @@ class AssetManager:
     
     def scale_image(self, image: pygame.Surface, width: int, height: int) -> pygame.Surface:
         """Scale an image and return the result"""
-        return pygame.transform.scale(image, (width, height))
+        scaled = pygame.transform.scale(image, (width, height))
+        if image in self.opaque_images:
+            self.opaque_images.add(scaled)
+        return scaled
+    
+    def _register_opacity(self, image: pygame.Surface):
+        """Record the image as opaque if drawing it fully covers its rect"""
+        if image.get_colorkey() is not None:
+            return
+        alpha = image.get_alpha()
+        if alpha is not None and alpha < 255:
+            return
+        # Per-pixel alpha - every pixel must be fully opaque
+        if image.get_flags() & pygame.SRCALPHA:
+            width, height = image.get_size()
+            if pygame.mask.from_surface(image, 254).count() != width * height:
+                return
+        self.opaque_images.add(image)
         
     def load_spritesheet(self, path: str, sprite_width: int, sprite_height: int, 
                         rows: int, cols: int) -> List[pygame.Surface]:
@@ -99,7 +118,7 @@ class AssetManager:
         if key not in self.assets:
             image = self.get_image(path)
             scaled_image = self.scale_image(image, width, height)
-            self.assets[key] = Asset(scaled_image)
+            self.assets[key] = Asset(scaled_image, source_path=path)
         return self.assets[key]
     
     def get_scaled_animation(self, paths: List[str], width: int, height: int, frame_delay=10) -> Animation:
@@ -145,3 +164,4 @@ class AssetManager:
         self.images.clear()
         self.animations.clear()
         self.assets.clear()
+        self.opaque_images.clear()
@@ -4,8 +4,37 @@ from ..component import Component
 
 @dataclass
 class AnimationComponent(Component):
-    """Component for animating entities"""
+    """Component for animating entities
+    
+    While AnimationSystems drive the animation, changes to active are passed on
+    to them, so their vectorized frame step only advances active animations.
+    """
     animation: Any = None  # Holds the Animation
     position: Tuple[int, int] = (0, 0)
     active: bool = True
-    name: str = ""
\ No newline at end of file
+    name: str = ""
+    
+    _clocks = None  # AnimationSystems that registered this component
+    
+    def bind_clock(self, clock):
+        if self._clocks is None:
+            self._clocks = []
+        self._clocks.append(clock)
+    
+    def unbind_clock(self, clock):
+        if self._clocks and clock in self._clocks:
+            self._clocks.remove(clock)
+
+def _get_active(self):
+    return self._active
+
+def _set_active(self, value):
+    value = bool(value)
+    changed = value != self.__dict__.get('_active', value)
+    self._active = value
+    if changed and self._clocks:
+        for clock in self._clocks:
+            clock.set_active(self, value)
+
+# Attached after the dataclass is built, so active keeps its field default
+AnimationComponent.active = property(_get_active, _set_active)
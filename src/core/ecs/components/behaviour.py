@@ -1,10 +1,161 @@
-from dataclasses import dataclass, field
+from collections.abc import MutableMapping
 from typing import Any, Dict, Optional
+import numpy as np
 from ..component import Component
 
-@dataclass
+# Behavior properties held in the component store, mapped to their column names
+STORED_PROPERTIES = {'energy': 'energy', 'money': 'money', 'mood': 'mood', 'is_alive': 'alive'}
+
+# Interned behavior states - the store keeps the small integer ID
+_STATE_NAMES = ['idle']
+_STATE_IDS = {'idle': 0}
+
+def state_id(state) -> int:
+    """Get the integer ID for a behavior state, registering it if new"""
+    sid = _STATE_IDS.get(state)
+    if sid is None:
+        sid = len(_STATE_NAMES)
+        _STATE_IDS[state] = sid
+        _STATE_NAMES.append(state)
+    return sid
+
+def state_name(sid: int) -> str:
+    """Get the behavior state for an integer ID from the store"""
+    return _STATE_NAMES[sid]
+
+class BehaviorProperties(MutableMapping):
+    """Dict-like behavior properties; vitals live in the store row once bound
+    
+    Missing stored values are NaN (floats) or -1 (is_alive), so get() still
+    returns its default for keys that were never set.
+    """
+    
+    def __init__(self, component, values: Dict[str, Any]):
+        self._component = component
+        self._values = {}  # Unstored keys, plus stored keys while unbound
+        self.update(values)
+    
+    def _row(self, key):
+        """Get (column, row) for a stored key, or None if it lives in the dict"""
+        field = STORED_PROPERTIES.get(key)
+        store = self._component._store
+        if field is None or store is None:
+            return None
+        return store.columns[field], store.id_to_row[self._component.entity_id]
+    
+    def __getitem__(self, key):
+        location = self._row(key)
+        if location is None:
+            return self._values[key]
+        column, row = location
+        value = column[row]
+        if key == 'is_alive':
+            if value < 0:
+                raise KeyError(key)
+            return bool(value)
+        if np.isnan(value):
+            raise KeyError(key)
+        return float(value)
+    
+    def get(self, key, default=None):
+        """Look up a property with a single row lookup, skipping the Mapping mixin"""
+        field = STORED_PROPERTIES.get(key)
+        store = self._component._store
+        if field is None or store is None:
+            return self._values.get(key, default)
+        value = store.columns[field][store.id_to_row[self._component.entity_id]]
+        if key == 'is_alive':
+            return default if value < 0 else bool(value)
+        return default if np.isnan(value) else float(value)
+    
+    def __setitem__(self, key, value):
+        location = self._row(key)
+        if location is None:
+            self._values[key] = value
+            return
+        column, row = location
+        column[row] = bool(value) if key == 'is_alive' else value
+    
+    def __delitem__(self, key):
+        location = self._row(key)
+        if location is None:
+            del self._values[key]
+            return
+        self[key]  # KeyError if unset
+        column, row = location
+        column[row] = -1 if key == 'is_alive' else np.nan
+    
+    def __iter__(self):
+        for key in self._values:
+            yield key
+        if self._component._store is not None:
+            for key in STORED_PROPERTIES:
+                if key in self:
+                    yield key
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+    
+    def __repr__(self):
+        return repr(dict(self))
+
 class BehaviorComponent(Component):
-    """Component for agent behavior"""
-    state: str = "idle"  # Current behavior state
-    target: Optional[int] = None  # Target entity ID if any
-    properties: Dict[str, Any] = field(default_factory=dict)  # Additional properties
+    """Component for agent behavior
+    
+    The current state and the energy/money/mood/is_alive properties live in
+    the ECS ComponentStore once the component is added, so systems can read
+    them for every agent at once.
+    """
+    
+    FIELDS = [('energy', 'f8'), ('money', 'f8'), ('mood', 'f8'), ('alive', 'i1'), ('state', 'i2')]
+    
+    def __init__(self, entity_id: int, state: str = "idle", target: Optional[int] = None,
+                 properties: Optional[Dict[str, Any]] = None):
+        super().__init__(entity_id)
+        self._store = None
+        self._state = state  # Current behavior state
+        self.target = target  # Target entity ID if any
+        self.properties = BehaviorProperties(self, properties or {})  # Additional properties
+    
+    def bind(self, store):
+        """Move state and stored properties into a ComponentStore row"""
+        state = self.state
+        stored = {key: self.properties._values.pop(key) for key in STORED_PROPERTIES if key in self.properties._values}
+        self._store = store
+        row = store.add(self.entity_id)
+        
+        # Rows are reused after removals, so every field is reset
+        for field in ('energy', 'money', 'mood'):
+            store.columns[field][row] = np.nan
+        store.columns['alive'][row] = -1
+        self.state = state
+        self.properties.update(stored)
+    
+    def unbind(self):
+        """Copy state and stored properties out of the store before its row is freed"""
+        if self._store is not None:
+            state = self.state
+            stored = {key: self.properties[key] for key in STORED_PROPERTIES if key in self.properties}
+            self._store = None
+            self._state = state
+            self.properties._values.update(stored)
+    
+    @property
+    def state(self):
+        if self._store is None:
+            return self._state
+        return _STATE_NAMES[self._store.columns['state'][self._store.id_to_row[self.entity_id]]]
+    
+    @state.setter
+    def state(self, value):
+        if self._store is None:
+            self._state = value
+            return
+        self._store.columns['state'][self._store.id_to_row[self.entity_id]] = state_id(value)
@@ -1,11 +1,66 @@
-from dataclasses import dataclass
 from typing import Tuple
 from ..component import Component
 
-@dataclass
 class TransformComponent(Component):
-    """Component for position and movement"""
-    position: Tuple[float, float] = (0, 0)
-    velocity: Tuple[float, float] = (0, 0)
-    rotation: float = 0
-    scale: float = 1.0
\ No newline at end of file
+    """Component for position and movement
+    
+    Position and velocity live in the ECS ComponentStore once the component is
+    added, so movement can be applied to all entities at once.
+    """
+    
+    FIELDS = [('x', 'f8'), ('y', 'f8'), ('vx', 'f8'), ('vy', 'f8')]
+    
+    def __init__(self, entity_id: int, position: Tuple[float, float] = (0, 0),
+                 velocity: Tuple[float, float] = (0, 0), rotation: float = 0, scale: float = 1.0):
+        super().__init__(entity_id)
+        self._store = None
+        self._position = position
+        self._velocity = velocity
+        self.rotation = rotation
+        self.scale = scale
+        
+    def bind(self, store):
+        """Move position/velocity into a ComponentStore row"""
+        position, velocity = self.position, self.velocity
+        self._store = store
+        store.add(self.entity_id)
+        self.position = position
+        self.velocity = velocity
+        
+    def unbind(self):
+        """Copy position/velocity out of the store before its row is freed"""
+        if self._store is not None:
+            self._position, self._velocity = self.position, self.velocity
+            self._store = None
+    
+    @property
+    def position(self) -> Tuple[float, float]:
+        if self._store is None:
+            return self._position
+        row = self._store.id_to_row[self.entity_id]
+        columns = self._store.columns
+        return (float(columns['x'][row]), float(columns['y'][row]))
+    
+    @position.setter
+    def position(self, value: Tuple[float, float]):
+        if self._store is None:
+            self._position = value
+            return
+        row = self._store.id_to_row[self.entity_id]
+        self._store.columns['x'][row], self._store.columns['y'][row] = value
+    
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        if self._store is None:
+            return self._velocity
+        row = self._store.id_to_row[self.entity_id]
+        columns = self._store.columns
+        return (float(columns['vx'][row]), float(columns['vy'][row]))
+    
+    @velocity.setter
+    def velocity(self, value: Tuple[float, float]):
+        if self._store is None:
+            self._velocity = value
+            return
+        row = self._store.id_to_row[self.entity_id]
+        self._store.columns['vx'][row], self._store.columns['vy'][row] = value
@@ -1,72 +1,382 @@
 # Genesis is used to handle the genetic and evolutionary aspects of the simulation
 
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from itertools import count as _counter
+from typing import Dict, List, Any, Optional, Union
+import numpy as np
 from .entity import Entity
 from .component import Component
 
+class ComponentStore:
+    """Struct-of-arrays storage for the numeric fields of one component type
+    
+    Each field lives in its own contiguous array so systems can update every
+    entity with a single vectorized operation. Rows are kept dense: removing
+    an entity moves the last row into the freed slot. version changes on every
+    add/remove (unique across stores), so row joins between stores can be cached.
+    """
+    
+    _versions = _counter()
+    
+    def __init__(self, fields, capacity: int = 64):
+        self.fields = fields
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in fields
+        }
+        self.row_to_id = np.full(capacity, -1, dtype=np.int64)
+        self.id_to_row: Dict[int, int] = {}
+        self.count = 0
+        self.version = next(ComponentStore._versions)
+        
+    @property
+    def capacity(self) -> int:
+        return len(self.row_to_id)
+        
+    def add(self, entity_id: int) -> int:
+        """Allocate (or return the existing) row for an entity"""
+        if entity_id in self.id_to_row:
+            return self.id_to_row[entity_id]
+        
+        # Grow geometrically when full
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+            
+        row = self.count
+        self.row_to_id[row] = entity_id
+        self.id_to_row[entity_id] = row
+        self.count += 1
+        self.version = next(ComponentStore._versions)
+        return row
+        
+    def remove(self, entity_id: int):
+        """Free an entity's row by swapping the last row into it"""
+        row = self.id_to_row.pop(entity_id, None)
+        if row is None:
+            return
+            
+        last = self.count - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved_id = int(self.row_to_id[last])
+            self.row_to_id[row] = moved_id
+            self.id_to_row[moved_id] = row
+            
+        self.row_to_id[last] = -1
+        self.count = last
+        self.version = next(ComponentStore._versions)
+        
+    def clear(self):
+        """Drop every row, keeping the allocated columns"""
+        self.row_to_id[:self.count] = -1
+        self.id_to_row.clear()
+        self.count = 0
+        self.version = next(ComponentStore._versions)
+        
+    def column(self, name: str) -> np.ndarray:
+        """Get the live slice of a field's array"""
+        return self.columns[name][:self.count]
+        
+    def ids(self) -> np.ndarray:
+        """Get the entity IDs for the live rows, in row order"""
+        return self.row_to_id[:self.count]
+        
+    def rows_for(self, entity_ids) -> np.ndarray:
+        """Map entity IDs to rows in this store, -1 where the entity has none"""
+        return np.fromiter(
+            (self.id_to_row.get(entity_id, -1) for entity_id in entity_ids),
+            dtype=np.intp, count=len(entity_ids)
+        )
+        
+    def reserve(self, capacity: int):
+        """Grow the columns up front so the next adds don't reallocate"""
+        if capacity > self.capacity:
+            self._grow(capacity)
+            
+    def _grow(self, capacity: int):
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+        row_to_id = np.full(capacity, -1, dtype=np.int64)
+        row_to_id[:self.count] = self.row_to_id[:self.count]
+        self.row_to_id = row_to_id
+
+class ComponentID(IntEnum):
+    """Pre-registered integer IDs for the built-in component types
+    
+    Hot paths can pass these instead of the string names to skip the name lookup.
+    """
+    TRANSFORM = 0
+    TAG = 1
+    RENDER = 2
+    ANIMATION = 3
+    BEHAVIOR = 4
+    WALLET = 5
+    WORKPLACE = 6
+    FARM = 7
+    RESERVES = 8
+    SOCIAL = 9
+    INVESTOR = 10
+    ECONOMIC = 11
+
+ComponentType = Union[str, int]
+
+# Entity IDs pack a reusable slot (low bits) with that slot's generation (high bits),
+# so an ID held after its entity is deleted never matches the slot's next entity
+ENTITY_SLOT_BITS = 32
+ENTITY_SLOT_MASK = (1 << ENTITY_SLOT_BITS) - 1
+
+def entity_slot(entity_id: int) -> int:
+    """Get the dense slot index of an entity ID"""
+    return entity_id & ENTITY_SLOT_MASK
+
 class ECS:
     """Container for all entities and components"""
     
-    def __init__(self):
+    def __init__(self, store_capacity: int = 64):
         self.entities: Dict[int, Entity] = {}
-        self.components: Dict[str, Dict[int, Component]] = {}
+        
+        # Entity slots are dense: freed slots are reused (with their generation
+        # bumped) before new ones are issued
+        self._next_slot = 0
+        self._free_list: List[int] = []
+        self._generations: List[int] = []  # Current generation of each slot
+        self.store_capacity = store_capacity  # Initial rows for each new ComponentStore
+        
+        # Component type names are interned to small integer IDs; components
+        # are stored in a list indexed by that ID
+        self._type_ids: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self.components: List[Dict[int, Component]] = []
+        for component_id in ComponentID:
+            self.register_component_type(component_id.name.lower())
+        
+        self.stores: Dict[int, ComponentStore] = {}  # SoA storage for types declaring FIELDS
+        self.entity_component_types: Dict[int, set] = {}  # Component type IDs owned by each entity
+        self._component_listeners: Dict[int, List[Any]] = {}  # Type ID -> [(on_add, on_remove)]
         self.systems: List[Any] = []
         self.systems_by_name: Dict[str, Any] = {}  # For easy lookup
+        self.systems_by_type: Dict[type, Any] = {}
+        
+        # Threads for running non-conflicting systems together in update(); 1 runs
+        # every system in order. Stages are rebuilt whenever a system is added.
+        self.workers = 1
+        self._executor = None
+        self._stages = None
+        
+    def register_component_type(self, name: str) -> int:
+        """Get the integer ID for a component type name, registering it if new"""
+        type_id = self._type_ids.get(name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_ids[name] = type_id
+            self._type_names.append(name)
+            self.components.append({})
+        return type_id
+        
+    def _type_id(self, component_type: ComponentType) -> Optional[int]:
+        """Resolve a component type name or ID without registering it"""
+        if isinstance(component_type, int):
+            return component_type
+        return self._type_ids.get(component_type)
+        
+    def add_component_listener(self, component_type: ComponentType, on_add, on_remove):
+        """Call on_add(entity_id, component) / on_remove(entity_id, component) as
+        components of a type are added to or leave the ECS"""
+        type_id = component_type if isinstance(component_type, int) else self.register_component_type(component_type)
+        self._component_listeners.setdefault(type_id, []).append((on_add, on_remove))
         
     def create_entity(self) -> int:
         """Create a new entity and return its ID"""
-        entity = Entity()
-        self.entities[entity.id] = entity
-        return entity.id
+        if self._free_list:
+            slot = self._free_list.pop()
+        else:
+            slot = self._next_slot
+            self._next_slot += 1
+            self._generations.append(0)
+        entity_id = (self._generations[slot] << ENTITY_SLOT_BITS) | slot
+        self.entities[entity_id] = Entity(entity_id)
+        return entity_id
         
     def delete_entity(self, entity_id: int):
         """Remove an entity and all its components"""
         if entity_id in self.entities:
-            # Remove all components for this entity
-            for component_type in list(self.components.keys()):
-                if entity_id in self.components[component_type]:
-                    del self.components[component_type][entity_id]
+            # Remove all components for this entity - only the types it owns
+            for component_type in self.entity_component_types.pop(entity_id, ()):
+                component = self.components[component_type].pop(entity_id, None)
+                
+                if component is not None:
+                    for _, on_remove in self._component_listeners.get(component_type, ()):
+                        on_remove(entity_id, component)
+                
+                # Move stored fields back onto the component before freeing its row
+                if component is not None and component_type in self.stores:
+                    component.unbind()
+                    self.stores[component_type].remove(entity_id)
             
-            # Remove the entity
+            # Remove the entity and recycle its slot
             del self.entities[entity_id]
+            self._release_slot(entity_id)
             
-    def add_component(self, entity_id: int, component_type: str, component: Component):
+    def _release_slot(self, entity_id: int):
+        """Free an entity's slot under a new generation, so its old ID goes stale"""
+        slot = entity_slot(entity_id)
+        self._generations[slot] += 1
+        self._free_list.append(slot)
+            
+    def clear(self):
+        """Remove every entity and component, keeping systems, type IDs and store capacity"""
+        for type_id, listeners in self._component_listeners.items():
+            for entity_id, component in self.components[type_id].items():
+                for _, on_remove in listeners:
+                    on_remove(entity_id, component)
+        
+        # Stored components keep working on their own once detached
+        for type_id in self.stores:
+            for component in self.components[type_id].values():
+                component.unbind()
+        
+        for components in self.components:
+            components.clear()
+        for store in self.stores.values():
+            store.clear()
+        # Slots keep counting generations, so IDs from before the clear stay stale
+        for entity_id in self.entities:
+            self._release_slot(entity_id)
+        self.entities.clear()
+        self.entity_component_types.clear()
+            
+    def create_entity_with_components(self, components: Dict[ComponentType, Component]) -> int:
+        """Create a new entity with all of its components and return its ID"""
+        entity_id = self.create_entity()
+        self.add_components(entity_id, components)
+        return entity_id
+        
+    def add_component(self, entity_id: int, component_type: ComponentType, component: Component):
         """Add a component to an entity"""
-        # Ensure the component type exists in our components dictionary
-        if component_type not in self.components:
-            self.components[component_type] = {}
+        self.add_components(entity_id, {component_type: component})
         
-        # Assign the component to the entity
-        component.entity_id = entity_id
-        self.components[component_type][entity_id] = component
+    def add_components(self, entity_id: int, components: Dict[ComponentType, Component]):
+        """Add several components to an entity, looking up its bookkeeping once"""
+        owned_types = self.entity_component_types.setdefault(entity_id, set())
+        entity = self.entities.get(entity_id)
         
-        # Also add to entity's components dict
-        if entity_id in self.entities:
-            self.entities[entity_id].add_component(component_type, component)
+        for component_type, component in components.items():
+            # Ensure the component type is registered
+            if isinstance(component_type, int):
+                type_id = component_type
+            else:
+                type_id = self.register_component_type(component_type)
+            
+            # Assign the component to the entity
+            component.entity_id = entity_id
+            replaced = self.components[type_id].get(entity_id)
+            self.components[type_id][entity_id] = component
+            owned_types.add(type_id)
+            
+            # Components declaring FIELDS keep their numeric data in a shared store
+            fields = getattr(component, 'FIELDS', None)
+            if fields is not None:
+                store = self.stores.get(type_id)
+                if store is None:
+                    store = self.stores[type_id] = ComponentStore(fields, self.store_capacity)
+                component.bind(store)
             
-    def get_component(self, entity_id: int, component_type: str) -> Component:
+            # Notify listeners, retiring any component this one replaces first
+            if replaced is not component:
+                for on_add, on_remove in self._component_listeners.get(type_id, ()):
+                    if replaced is not None:
+                        on_remove(entity_id, replaced)
+                    on_add(entity_id, component)
+            
+            # Also add to entity's components dict
+            if entity is not None:
+                entity.components[self._type_names[type_id]] = component
+            
+    def get_component(self, entity_id: int, component_type: ComponentType) -> Component:
         """Get a specific component for an entity"""
-        if component_type in self.components and entity_id in self.components[component_type]:
-            return self.components[component_type][entity_id]
-        return None
+        type_id = component_type if isinstance(component_type, int) else self._type_ids.get(component_type)
+        if type_id is None:
+            return None
+        return self.components[type_id].get(entity_id)
         
-    def get_components_by_type(self, component_type: str) -> Dict[int, Component]:
+    def get_components_by_type(self, component_type: ComponentType) -> Dict[int, Component]:
         """Get all components of a specific type"""
-        return self.components.get(component_type, {})
+        type_id = self._type_id(component_type)
+        if type_id is None:
+            return {}
+        return self.components[type_id]
+        
+    def get_component_store(self, component_type: ComponentType) -> Optional[ComponentStore]:
+        """Get the struct-of-arrays store for a component type, if it has one"""
+        return self.stores.get(self._type_id(component_type))
         
     def add_system(self, system):
         """Add a system to the world"""
         self.systems.append(system)
         
-        # Store system by class name for easy lookup
+        # Store system by class name for easy lookup, and by class for direct access
         system_name = system.__class__.__name__.lower().replace('system', '')
         self.systems_by_name[system_name] = system
+        self.systems_by_type[type(system)] = system
+        self._stages = None
         
-    def get_system(self, name: str):
-        """Get a system by name"""
+    def get_system(self, name: Union[str, type]):
+        """Get a system by name or by class"""
+        if isinstance(name, type):
+            return self.systems_by_type.get(name)
         return self.systems_by_name.get(name)
         
     def update(self, dt: float):
         """Update all systems"""
-        for system in self.systems:
-            system.update(dt)
\ No newline at end of file
+        if self.workers <= 1:
+            for system in self.systems:
+                system.update(dt)
+            return
+        
+        if self._stages is None:
+            self._stages = self._build_stages()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        
+        # Systems within a stage don't conflict, so they can run at the same time
+        for stage in self._stages:
+            if len(stage) == 1:
+                stage[0].update(dt)
+            else:
+                list(self._executor.map(lambda system: system.update(dt), stage))
+            
+    def shutdown(self):
+        """Stop the system worker threads, if any were started; a later update starts new ones"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            
+    def _build_stages(self) -> List[List[Any]]:
+        """Group systems into stages, each one after every earlier system it conflicts with"""
+        stages = []
+        levels = []
+        for i, system in enumerate(self.systems):
+            level = 0
+            for j in range(i):
+                if self._conflicts(self.systems[j], system):
+                    level = max(level, levels[j] + 1)
+            levels.append(level)
+            if level == len(stages):
+                stages.append([])
+            stages[level].append(system)
+        return stages
+        
+    @staticmethod
+    def _conflicts(first, second) -> bool:
+        """Whether two systems touch the same state with at least one of them writing it"""
+        first_reads, first_writes = getattr(first, 'reads', None), getattr(first, 'writes', None)
+        second_reads, second_writes = getattr(second, 'reads', None), getattr(second, 'writes', None)
+        if None in (first_reads, first_writes, second_reads, second_writes):
+            return True
+        return bool(
+            set(first_writes) & (set(second_reads) | set(second_writes))
+            or set(second_writes) & set(first_reads)
+        )
\ No newline at end of file
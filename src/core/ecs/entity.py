@@ -9,8 +9,8 @@ class Entity:
         cls._next_id += 1
         return entity_id
     
-    def __init__(self):
-        self.id = Entity.get_id()
+    def __init__(self, entity_id=None):
+        self.id = Entity.get_id() if entity_id is None else entity_id
         self.components = {}
         
     def add_component(self, component_type, component):
@@ -1,5 +1,13 @@
 class System:
-    """Base class for all systems"""
+    """Base class for all systems
+    
+    reads/writes name the component types (or other shared state) a system
+    touches, so ECS.update can run systems that don't conflict side by side.
+    None means unknown, and such a system always runs on its own.
+    """
+    
+    reads = None
+    writes = None
     
     def __init__(self, world):
         self.world = world
@@ -1,10 +1,141 @@
+from typing import Any, Dict
+import numpy as np
 from ..system import System
 
 class AnimationSystem(System):
-    """System for updating entity animations"""
-    
+    """System for updating entity animations
+
+    Frame clocks for every registered animation live in flat arrays and are
+    advanced together once per frame, instead of one Animation.update() call
+    per component. Animations are shared between entities, so each slot counts
+    the components using it; the ECS adds and removes those as components come
+    and go, and a slot only advances while one of its components is active.
+    """
+
+    reads = ('animation',)
+    writes = ('animation',)
+
+    _COLUMNS = ('frame_counter', 'frame_delay', 'frame_count', 'current_frame', 'users', 'active_users')
+
+    def __init__(self, world, capacity: int = 64):
+        super().__init__(world)
+        self.count = 0
+        self.frame_counter = np.zeros(capacity, dtype=np.int32)
+        self.frame_delay = np.zeros(capacity, dtype=np.int32)
+        self.frame_count = np.ones(capacity, dtype=np.int32)
+        self.current_frame = np.zeros(capacity, dtype=np.int32)
+        self.users = np.zeros(capacity, dtype=np.int32)  # Components registered per slot
+        self.active_users = np.zeros(capacity, dtype=np.int32)  # ...of which are active
+        self.animations = []
+        self._slots: Dict[int, int] = {}  # id(animation) -> slot
+        self._entity_animations: Dict[int, Any] = {}  # entity ID -> registered animation
+
+        # Follow animation components through the ECS, starting with any already there
+        world.add_component_listener("animation", self.register_component, self.unregister_component)
+        for entity_id, component in list(world.get_components_by_type("animation").items()):
+            self.register_component(entity_id, component)
+
+    def register(self, animation) -> int:
+        """Move an animation's frame clock into this system and return its slot"""
+        slot = self._slots.get(id(animation))
+        if slot is not None:
+            return slot
+
+        if self.count == len(self.frame_counter):
+            self._grow(self.count * 2)
+
+        slot = self.count
+        self.frame_counter[slot] = animation.frame_counter
+        self.frame_delay[slot] = animation.frame_delay
+        self.frame_count[slot] = len(animation.images)
+        self.current_frame[slot] = animation.current_frame
+        self.users[slot] = 0
+        self.active_users[slot] = 0
+        self.animations.append(animation)
+        self._slots[id(animation)] = slot
+        self.count += 1
+
+        animation.bind_clock(self, slot)
+        return slot
+
+    def register_component(self, entity_id, component):
+        """Start counting an entity's animation component (called by the ECS on add)"""
+        if component.animation is None or entity_id in self._entity_animations:
+            return
+        slot = self.register(component.animation)
+        self.users[slot] += 1
+        if component.active:
+            self.active_users[slot] += 1
+        self._entity_animations[entity_id] = component.animation
+        component.bind_clock(self)
+
+    def unregister_component(self, entity_id, component):
+        """Stop counting an entity's animation component, freeing its slot once unused"""
+        animation = self._entity_animations.pop(entity_id, None)
+        if animation is None:
+            return
+        component.unbind_clock(self)
+        slot = self._slots[id(animation)]
+        self.users[slot] -= 1
+        if component.active:
+            self.active_users[slot] -= 1
+        if self.users[slot] == 0:
+            self._release(slot)
+
+    def set_active(self, component, active: bool):
+        """Track a registered component being switched on or off"""
+        animation = self._entity_animations.get(component.entity_id)
+        if animation is not None:
+            self.active_users[self._slots[id(animation)]] += 1 if active else -1
+
+    def _release(self, slot: int):
+        """Hand a slot's animation back its clock and move the last slot into its place"""
+        animation = self.animations[slot]
+        if animation._clock is self:
+            animation.unbind_clock()
+        del self._slots[id(animation)]
+
+        last = self.count - 1
+        if slot != last:
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            moved = self.animations[last]
+            self.animations[slot] = moved
+            self._slots[id(moved)] = slot
+            if moved._clock is self:
+                moved.bind_clock(self, slot)
+
+        self.animations.pop()
+        self.count = last
+
     def update(self, dt):
-        # Get all entities with AnimationComponent
-        for entity_id, component in self.world.get_components_by_type("animation").items():
-            if component.active:
-                component.animation.update()
\ No newline at end of file
+        if self.count == 0:
+            return
+
+        # Advance the clocks of active animations, then step the frames whose delay has elapsed
+        n = self.count
+        active = self.active_users[:n] > 0
+        counter = self.frame_counter[:n]
+        np.add(counter, 1, out=counter, where=active)
+        advanced = active & (counter >= self.frame_delay[:n])
+        if not advanced.any():
+            return
+
+        counter[advanced] = 0
+        frames = self.current_frame[:n]
+        previous = frames[advanced]
+        stepped = (previous + 1) % self.frame_count[:n][advanced]
+        frames[advanced] = stepped
+
+        # Mark animations as dirty only when their frame actually changed
+        # (single-frame animations wrap back to the same frame)
+        for slot in np.flatnonzero(advanced)[stepped != previous].tolist():
+            self.animations[slot].dirty = True
+
+    def _grow(self, capacity: int):
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
@@ -1,19 +1,52 @@
+import numpy as np
 from ..system import System
 
 class MovementSystem(System):
     """System for updating entity positions based on velocity"""
     
+    reads = ('transform', 'behavior')
+    writes = ('transform', 'render')
+    
+    def __init__(self, world):
+        super().__init__(world)
+        # Transform row -> behavior row join, rebuilt only when either store changes
+        self._join_key = None
+        self._behavior_rows = None
+    
     def update(self, dt):
-        # Get all entities with TransformComponent
-        for entity_id, transform in self.world.get_components_by_type("transform").items():
-            behavior = self.world.get_component(entity_id, "behavior")
-            if behavior and behavior.properties.get("is_alive") is True:
-                # Update position based on velocity
-                x, y = transform.position
-                vx, vy = transform.velocity
-                transform.position = (x + vx * dt, y + vy * dt)
+        # Transforms are stored column-wise, so all positions update at once
+        store = self.world.get_component_store("transform")
+        if store is None or store.count == 0:
+            return
+            
+        # Only living agents move - read their alive flags straight from the behavior store
+        moving = self._alive_mask(store)
+        if not moving.any():
+            return
+            
+        # Update position based on velocity
+        store.column('x')[moving] += store.column('vx')[moving] * dt
+        store.column('y')[moving] += store.column('vy')[moving] * dt
+        
+        # Update any render component to match new position
+        rows = np.flatnonzero(moving)
+        renders = self.world.get_components_by_type("render")
+        for entity_id, x, y in zip(store.ids()[rows].tolist(), store.columns['x'][rows].tolist(),
+                                   store.columns['y'][rows].tolist()):
+            render = renders.get(entity_id)
+            if render:
+                render.position = (x, y)
                 
-                # Update any render component to match new position
-                render = self.world.get_component(entity_id, "render")
-                if render:
-                    render.position = transform.position
\ No newline at end of file
+    def _alive_mask(self, store):
+        """Boolean mask over transform rows of entities whose behavior says they are alive"""
+        behaviors = self.world.get_component_store("behavior")
+        if behaviors is None:
+            return np.zeros(store.count, dtype=bool)
+        
+        key = (store.version, behaviors.version)
+        if key != self._join_key:
+            self._behavior_rows = behaviors.rows_for(store.ids().tolist())
+            self._join_key = key
+            
+        rows = self._behavior_rows
+        return (rows >= 0) & (behaviors.columns['alive'][rows] == 1)
@@ -2,6 +2,10 @@ import random
 import math
 
 class NavigationSystem:
+    # Its per-tick update does nothing, so it never conflicts with another system
+    reads = ()
+    writes = ()
+    
     def __init__(self, world):
         self.world = world
     
@@ -1,10 +1,14 @@
 import pygame
 from ..system import System
+from ..components.behaviour import state_name
 from src.ui.render.manager import RenderManager
 
 class RenderSystem(System):
     """System for rendering entities with RenderComponent using optimized batching"""
     
+    reads = ('render', 'transform', 'tag', 'behavior', 'animation')
+    writes = ('render', 'screen')
+    
     def __init__(self, world, screen):
         super().__init__(world)
         self.screen = screen
@@ -24,35 +28,43 @@ class RenderSystem(System):
         
     def _batch_visible_entities(self):
         """Batch visible entities for efficient rendering"""
+        # Positions and agent state are read straight from the store rows
+        transforms = self.world.get_component_store("transform")
+        if transforms is None:
+            return
+        xs, ys = transforms.columns['x'], transforms.columns['y']
+        behaviors = self.world.get_component_store("behavior")
+        
         # Get all entities with RenderComponent
         for entity_id, component in self.world.get_components_by_type("render").items():
             # Skip if not visible
             if not component.visible:
                 continue
                 
-            # Get transform component for position
-            transform = self.world.get_component(entity_id, "transform")
-            if not transform:
+            # Get transform row for position
+            transform_row = transforms.id_to_row.get(entity_id)
+            if transform_row is None:
                 continue
                 
             # Check for agent state in components
             tag_comp = self.world.get_component(entity_id, "tag")
             if tag_comp and tag_comp.tag == "agent":
                 # If we have a behavior component, it may have state info
-                behavior = self.world.get_component(entity_id, "behavior")
-                if behavior:
+                row = behaviors.id_to_row.get(entity_id) if behaviors is not None else None
+                if row is not None:
                     # Check if agent is dead
-                    if behavior.properties.get("is_alive") is False:
+                    if behaviors.columns['alive'][row] == 0:
                         # Find dead asset
                         for entity_asset in component.alt_assets:
                             if entity_asset.key == "dead":
                                 component.asset = entity_asset.asset
                                 break
                     # Otherwise check normal state
-                    elif behavior.state:
+                    else:
+                        state = state_name(behaviors.columns['state'][row])
                         # Try to find an asset for this state
                         for entity_asset in component.alt_assets:
-                            if entity_asset.key == behavior.state:
+                            if entity_asset.key == state:
                                 component.asset = entity_asset.asset
                                 break
             
@@ -61,15 +73,17 @@ class RenderSystem(System):
             if not asset:
                 continue
                 
+            position = (float(xs[transform_row]), float(ys[transform_row]))
+            
             # Create a unique texture ID (for animations we'll need the frame)
             if hasattr(asset, 'image'):
                 # Regular asset
                 texture_id = (asset.image, entity_id)
                 self.render_manager.add_to_batch(
                     texture_id, 
-                    transform.position,
+                    position,
                     None,
-                    pygame.Rect(transform.position[0], transform.position[1], 
+                    pygame.Rect(position[0], position[1], 
                               component.size[0], component.size[1])
                 )
             elif hasattr(asset, 'images') and asset.images:
@@ -78,8 +92,8 @@ class RenderSystem(System):
                 texture_id = (current_image, entity_id, asset.current_frame)
                 self.render_manager.add_to_batch(
                     texture_id,
-                    transform.position,
+                    position,
                     None,
-                    pygame.Rect(transform.position[0], transform.position[1], 
+                    pygame.Rect(position[0], position[1], 
                               component.size[0], component.size[1])
                 )
\ No newline at end of file
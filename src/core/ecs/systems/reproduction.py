@@ -49,8 +49,8 @@ class ReproductionSystem:
             
             # Add the new agent to the world using the entity factory
             self.world.entity_factory.register_existing_entity(offspring)
-            self.world.entities.append(offspring)
-            self.world.society.population.append(offspring)
+            self.world.track_entity(offspring)
+            self.world.society.add_agent(offspring)
             
             return offspring
             
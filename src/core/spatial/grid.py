@@ -21,6 +21,20 @@ class SpatialGrid:
         
         # Entity to cell mapping for fast lookups
         self.entity_cells: Dict[int, Tuple[int, int]] = {}
+        
+        # Per-tag grids, so tag queries only visit cells holding that tag
+        self.tag_grids: Dict[str, Dict[Tuple[int, int], Set[int]]] = {}
+        self.entity_tags: Dict[int, str] = {}
+    
+    def clear(self) -> None:
+        """Remove every entity, emptying cells in place rather than dropping them"""
+        for cell in self.grid.values():
+            cell.clear()
+        for tag_grid in self.tag_grids.values():
+            for cell in tag_grid.values():
+                cell.clear()
+        self.entity_cells.clear()
+        self.entity_tags.clear()
     
     def get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
         """Convert world coordinates to grid cell coordinates"""
@@ -28,9 +42,15 @@ class SpatialGrid:
         row = max(0, min(self.rows - 1, int(y / self.cell_size)))
         return (col, row)
     
-    def insert(self, entity_id: int, x: float, y: float) -> None:
-        """Insert an entity into the grid at the specified position"""
+    def insert(self, entity_id: int, x: float, y: float, tag: Optional[str] = None) -> None:
+        """Insert an entity into the grid at the specified position
+        
+        Tagged entities are also indexed in that tag's grid; re-inserting an
+        entity without a tag keeps the tag it already had.
+        """
         cell_coords = self.get_cell_coords(x, y)
+        if tag is None:
+            tag = self.entity_tags.get(entity_id)
         
         # Remove from previous cell if it exists
         self.remove(entity_id)
@@ -44,6 +64,11 @@ class SpatialGrid:
         
         # Store entity's cell for fast lookups
         self.entity_cells[entity_id] = cell_coords
+        
+        # Add entity to its tag's grid
+        if tag is not None:
+            self.tag_grids.setdefault(tag, {}).setdefault(cell_coords, set()).add(entity_id)
+            self.entity_tags[entity_id] = tag
     
     def remove(self, entity_id: int) -> None:
         """Remove an entity from the grid"""
@@ -55,6 +80,14 @@ class SpatialGrid:
                 # Clean up empty cells
                 if not self.grid[cell_coords]:
                     del self.grid[cell_coords]
+            
+            # Remove from the tag's grid too
+            tag = self.entity_tags.pop(entity_id, None)
+            if tag is not None:
+                tag_grid = self.tag_grids[tag]
+                tag_grid[cell_coords].discard(entity_id)
+                if not tag_grid[cell_coords]:
+                    del tag_grid[cell_coords]
                     
             del self.entity_cells[entity_id]
     
@@ -87,6 +120,26 @@ class SpatialGrid:
         
         return result
     
+    def get_entities_by_tag(self, tag: str, x: float, y: float, radius: float) -> Set[int]:
+        """Get entities with a tag near a point, visiting only that tag's cells"""
+        tag_grid = self.tag_grids.get(tag)
+        if not tag_grid:
+            return set()
+        
+        # Calculate cell range to check
+        start_col, start_row = self.get_cell_coords(x - radius, y - radius)
+        end_col, end_row = self.get_cell_coords(x + radius, y + radius)
+        
+        # Collect entities from the tag's cells in range
+        result = set()
+        for col in range(start_col, end_col + 1):
+            for row in range(start_row, end_row + 1):
+                cell = tag_grid.get((col, row))
+                if cell:
+                    result.update(cell)
+        
+        return result
+    
     def get_entities_in_rect(self, x: float, y: float, width: float, height: float) -> Set[int]:
         """Get all entities within a rectangular region"""
         # Calculate cell range to check
@@ -4,14 +4,19 @@ import math
 class SpatialSystem:
     """System that maintains the spatial grid by tracking entity positions"""
     
+    reads = ('transform',)
+    writes = ('spatial_grid',)
+    
     def __init__(self, world, grid):
         self.world = world
         self.grid = grid
         
     def update(self, dt):
-        # Update all entities with transform components
-        for entity_id, transform in self.world.get_components_by_type("transform").items():
-            x, y = transform.position
+        # Update all entities with transform components, reading the position columns directly
+        store = self.world.get_component_store("transform")
+        if store is None:
+            return
+        for entity_id, x, y in zip(store.ids().tolist(), store.column('x').tolist(), store.column('y').tolist()):
             self.grid.update(entity_id, x, y)
     
     def find_nearest(self, position: Tuple[float, float], 
@@ -40,14 +45,17 @@ class SpatialSystem:
             components = self.world.get_components_by_type(component_type)
             entity_ids = [eid for eid in entity_ids if eid in components]
         
-        # Sort by distance
+        # Sort by distance, reading positions from the transform columns
+        store = self.world.get_component_store("transform")
+        if store is None:
+            return []
+        xs, ys = store.columns['x'], store.columns['y']
         entities_with_distances = []
         for eid in entity_ids:
-            transform = self.world.get_component(eid, "transform")
-            if transform:
+            row = store.id_to_row.get(eid)
+            if row is not None:
                 # Calculate distance
-                ex, ey = transform.position
-                distance = math.sqrt((ex - x) ** 2 + (ey - y) ** 2)
+                distance = math.sqrt((xs[row] - x) ** 2 + (ys[row] - y) ** 2)
                 entities_with_distances.append((eid, distance))
         
         # Sort by distance and return entity IDs
@@ -53,25 +53,15 @@ class Serialization:
             return False
     
     @staticmethod
-    def save_neural_network(network, filename: str) -> None:
-        """Save neural network weights and biases"""
-        np.savez(
-            filename, 
-            w_input_hidden=network.weights_input_hidden,
-            w_hidden_output=network.weights_hidden_output,
-            b_hidden=network.bias_hidden,
-            b_output=network.bias_output
-        )
+    def save_neural_network(network, dirpath: str) -> None:
+        """Save neural network weights and biases (one .npy file per array)"""
+        network.save(dirpath)
     
     @staticmethod
-    def load_neural_network(network, filename: str) -> bool:
-        """Load neural network weights and biases"""
+    def load_neural_network(network, dirpath: str, mmap: bool = True) -> bool:
+        """Load neural network weights and biases, memory-mapped by default"""
         try:
-            data = np.load(filename)
-            network.weights_input_hidden = data['w_input_hidden']
-            network.weights_hidden_output = data['w_hidden_output']
-            network.bias_hidden = data['b_hidden']
-            network.bias_output = data['b_output']
+            network.load(dirpath, mmap=mmap)
             return True
         except Exception as e:
             print(f"Error loading neural network: {e}")
@@ -1,7 +1,136 @@
+import os
 import numpy as np
 import random
+from math import exp
 from typing import List, Dict, Tuple, Any
 
+# Numba is optional - without it the networks use the plain NumPy implementation
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Shared generator for weight initialization
+_rng = np.random.default_rng()
+
+# One-hot encoded state features: (state key, level -> column offset); missing or
+# unknown levels fall into the last column, matching the original if/elif chains
+LEVEL_FEATURES = [
+    ('energy', {'low': 0, 'medium': 1}),
+    ('money', {'low': 0, 'medium': 1}),
+    ('mood', {'negative': 0, 'neutral': 1}),
+    ('corruption', {'low': 0, 'medium': 1}),
+    ('food_reserves', {'low': 0, 'medium': 1}),
+]
+
+# Boolean state features, encoded as a single 0/1 column each
+FLAG_FEATURES = ['knows_farm_location', 'knows_yield_farm', 'knows_workplace', 'has_trading_partners']
+
+# String action names used by the Q-table, mapped to network output indices
+ACTION_INDICES = {
+    'eat': 0, 'work': 1, 'rest': 2, 'mate': 3, 'search': 4,
+    'plant-food': 5, 'harvest-food': 6, 'gift-food': 7, 'gift-money': 8,
+    'invest': 9, 'buy-food': 10, 'sell-food': 11,
+    'trade-food-for-money': 12, 'trade-money-for-food': 13
+}
+
+# Per-array checkpoint files written by NeuralNetwork.save: (filename, attribute)
+WEIGHT_FILES = [
+    ('W1.npy', 'weights_input_hidden'),
+    ('W2.npy', 'weights_hidden_output'),
+    ('b1.npy', 'bias_hidden'),
+    ('b2.npy', 'bias_output'),
+]
+
+def _forward_kernel(x, w1, b1, w2, b2, h_out, y_out):
+    """Fused matmul + bias + sigmoid for a single input row"""
+    for j in range(w1.shape[1]):
+        s = b1[0, j]
+        for i in range(x.shape[0]):
+            s += x[i] * w1[i, j]
+        h_out[0, j] = 1.0 / (1.0 + exp(-s))
+    
+    for k in range(w2.shape[1]):
+        s = b2[0, k]
+        for j in range(w2.shape[0]):
+            s += h_out[0, j] * w2[j, k]
+        y_out[0, k] = 1.0 / (1.0 + exp(-s))
+
+
+def _forward_argmax_kernel(x, w1, b1, w2, b2, h_out, y_out, approximate):
+    """Like _forward_kernel, but stops before the output sigmoid (argmax-only callers)
+    
+    With approximate=True the hidden layer uses 0.5 + 0.5 * s / (2 + |s|) instead of exp.
+    """
+    for j in range(w1.shape[1]):
+        s = b1[0, j]
+        for i in range(x.shape[0]):
+            s += x[i] * w1[i, j]
+        if approximate:
+            h_out[0, j] = 0.5 + 0.5 * s / (2.0 + abs(s))
+        else:
+            h_out[0, j] = 1.0 / (1.0 + exp(-s))
+    
+    for k in range(w2.shape[1]):
+        s = b2[0, k]
+        for j in range(w2.shape[0]):
+            s += h_out[0, j] * w2[j, k]
+        y_out[0, k] = s
+
+
+def _train_kernel(x, t, w1, b1, w2, b2, lr, hidden_buf, out_buf):
+    """One batch gradient step, matching NeuralNetwork.train's NumPy update"""
+    input_size, hidden_size = w1.shape
+    output_size = w2.shape[1]
+    
+    # Gradients are accumulated over the batch and applied once at the end
+    grad_w1 = np.zeros((input_size, hidden_size))
+    grad_b1 = np.zeros(hidden_size)
+    grad_w2 = np.zeros((hidden_size, output_size))
+    grad_b2 = np.zeros(output_size)
+    output_errors = np.empty(output_size)
+    
+    for r in range(x.shape[0]):
+        _forward_kernel(x[r], w1, b1, w2, b2, hidden_buf, out_buf)
+        
+        # Output layer
+        for k in range(output_size):
+            y = out_buf[0, k]
+            output_errors[k] = t[r, k] - y
+            delta = output_errors[k] * y * (1.0 - y)
+            grad_b2[k] += delta
+            for j in range(hidden_size):
+                grad_w2[j, k] += hidden_buf[0, j] * delta
+        
+        # Hidden layer - errors are propagated through the pre-update weights
+        for j in range(hidden_size):
+            error = 0.0
+            for k in range(output_size):
+                error += output_errors[k] * w2[j, k]
+            h = hidden_buf[0, j]
+            delta = error * h * (1.0 - h)
+            grad_b1[j] += delta
+            for i in range(input_size):
+                grad_w1[i, j] += x[r, i] * delta
+    
+    # Apply the accumulated updates
+    for j in range(hidden_size):
+        b1[0, j] += lr * grad_b1[j]
+        for i in range(input_size):
+            w1[i, j] += lr * grad_w1[i, j]
+    for k in range(output_size):
+        b2[0, k] += lr * grad_b2[k]
+        for j in range(hidden_size):
+            w2[j, k] += lr * grad_w2[j, k]
+
+
+if NUMBA_AVAILABLE:
+    _forward_kernel = njit(cache=True, fastmath=True)(_forward_kernel)
+    _forward_argmax_kernel = njit(cache=True, fastmath=True)(_forward_argmax_kernel)
+    _train_kernel = njit(cache=True, fastmath=True)(_train_kernel)
+
+
 class NeuralNetwork:
     def __init__(self, input_size: int, hidden_size: int, output_size: int, learning_rate: float = 0.01):
         self.input_size = input_size
@@ -9,39 +138,126 @@ class NeuralNetwork:
         self.output_size = output_size
         self.learning_rate = learning_rate
         
-        # Initialize weights with small random values
-        self.weights_input_hidden = np.random.randn(input_size, hidden_size) * 0.1
-        self.weights_hidden_output = np.random.randn(hidden_size, output_size) * 0.1
+        # Initialize weights with small random values (float32 halves memory traffic)
+        self.weights_input_hidden = _rng.standard_normal((input_size, hidden_size), dtype=np.float32) * np.float32(0.1)
+        self.weights_hidden_output = _rng.standard_normal((hidden_size, output_size), dtype=np.float32) * np.float32(0.1)
         
         # Initialize biases
-        self.bias_hidden = np.zeros((1, hidden_size))
-        self.bias_output = np.zeros((1, output_size))
+        self.bias_hidden = np.zeros((1, hidden_size), dtype=np.float32)
+        self.bias_output = np.zeros((1, output_size), dtype=np.float32)
+        
+        # Preallocated activation buffers, grown to the largest batch seen; forward
+        # returns views into them, so results are only valid until the next call
+        self._hidden_buf = np.zeros((1, hidden_size), dtype=np.float32)
+        self._output_buf = np.zeros((1, output_size), dtype=np.float32)
+    
+    def sigmoid(self, x, out=None):
+        """Logistic function, written into out when a buffer is supplied"""
+        out = np.negative(x, out=out)
+        np.exp(out, out=out)
+        np.add(1.0, out, out=out)
+        return np.reciprocal(out, out=out)
     
-    def sigmoid(self, x):
-        return 1 / (1 + np.exp(-x))
+    def fast_sigmoid(self, x, out=None):
+        """Rational sigmoid approximation 0.5 + 0.5 * x / (2 + |x|) - monotonic, no exp"""
+        denominator = np.abs(x)
+        denominator += 2.0
+        out = np.divide(x, denominator, out=out)
+        out *= 0.5
+        out += 0.5
+        return out
     
     def sigmoid_derivative(self, x):
         return x * (1 - x)
     
     def forward(self, inputs):
-        # Convert inputs to numpy array
-        inputs = np.array(inputs, ndmin=2)
+        # View inputs as a 2D float32 array (no copy for arrays already encoded)
+        inputs = np.asarray(inputs, dtype=np.float32).reshape(-1, self.input_size)
         
-        # Calculate signals into hidden layer
-        self.hidden_inputs = np.dot(inputs, self.weights_input_hidden) + self.bias_hidden
+        # Single rows go through the fused compiled kernel when Numba is present
+        if NUMBA_AVAILABLE and inputs.shape[0] == 1:
+            _forward_kernel(
+                inputs[0], self.weights_input_hidden, self.bias_hidden,
+                self.weights_hidden_output, self.bias_output,
+                self._hidden_buf, self._output_buf
+            )
+            self.hidden_outputs = self._hidden_buf[:1]
+            self.final_outputs = self._output_buf[:1]
+            return self.final_outputs
         
-        # Calculate signals from hidden layer
-        self.hidden_outputs = self.sigmoid(self.hidden_inputs)
+        # Grow the activation buffers when the batch outgrows them
+        rows = inputs.shape[0]
+        if rows > self._hidden_buf.shape[0]:
+            self._resize_buffers(rows)
+        hidden = self._hidden_buf[:rows]
+        outputs = self._output_buf[:rows]
         
-        # Calculate signals into final output layer
-        self.final_inputs = np.dot(self.hidden_outputs, self.weights_hidden_output) + self.bias_output
+        # Calculate signals into and out of the hidden layer
+        np.dot(inputs, self.weights_input_hidden, out=hidden)
+        hidden += self.bias_hidden
+        self.hidden_outputs = self.sigmoid(hidden, out=hidden)
         
-        # Calculate signals from final output layer
-        self.final_outputs = self.sigmoid(self.final_inputs)
+        # Calculate signals into and out of the final output layer
+        np.dot(self.hidden_outputs, self.weights_hidden_output, out=outputs)
+        outputs += self.bias_output
+        self.final_outputs = self.sigmoid(outputs, out=outputs)
         
         return self.final_outputs
     
+    def _resize_buffers(self, rows: int):
+        """Reallocate the activation buffers to hold at least rows inputs"""
+        self._hidden_buf = np.zeros((rows, self.hidden_size), dtype=np.float32)
+        self._output_buf = np.zeros((rows, self.output_size), dtype=np.float32)
+    
+    def forward_for_argmax(self, inputs, approximate=False):
+        """Forward pass returning output pre-activations, for argmax-only callers
+        
+        Sigmoid is monotonic, so skipping it on the output layer keeps the ranking.
+        With approximate=True the hidden layer uses fast_sigmoid instead of exp.
+        Like forward, the result is a view into the activation buffers.
+        """
+        inputs = np.asarray(inputs, dtype=np.float32).reshape(-1, self.input_size)
+        
+        # Single rows go through the compiled kernel when Numba is present
+        if NUMBA_AVAILABLE and inputs.shape[0] == 1:
+            _forward_argmax_kernel(
+                inputs[0], self.weights_input_hidden, self.bias_hidden,
+                self.weights_hidden_output, self.bias_output,
+                self._hidden_buf, self._output_buf, approximate
+            )
+            return self._output_buf[:1]
+        
+        rows = inputs.shape[0]
+        if rows > self._hidden_buf.shape[0]:
+            self._resize_buffers(rows)
+        hidden = self._hidden_buf[:rows]
+        outputs = self._output_buf[:rows]
+        
+        np.dot(inputs, self.weights_input_hidden, out=hidden)
+        hidden += self.bias_hidden
+        if approximate:
+            self.fast_sigmoid(hidden, out=hidden)
+        else:
+            self.sigmoid(hidden, out=hidden)
+        
+        np.dot(hidden, self.weights_hidden_output, out=outputs)
+        outputs += self.bias_output
+        return outputs
+    
     def train(self, inputs, targets):
+        # View inputs as a 2D float32 array
+        inputs = np.asarray(inputs, dtype=np.float32).reshape(-1, self.input_size)
+        
+        # Use the fused compiled training step when Numba is present
+        if NUMBA_AVAILABLE:
+            _train_kernel(
+                inputs, np.asarray(targets).reshape(-1, self.output_size),
+                self.weights_input_hidden, self.bias_hidden,
+                self.weights_hidden_output, self.bias_output,
+                self.learning_rate, self._hidden_buf, self._output_buf
+            )
+            return
+        
         # Forward pass
         outputs = self.forward(inputs)
         
@@ -54,44 +270,41 @@ class NeuralNetwork:
         # Calculate hidden layer error
         hidden_errors = np.dot(output_errors, self.weights_hidden_output.T)
         
+        # Output deltas: errors * outputs * (1 - outputs), computed in one buffer
+        output_deltas = np.subtract(1.0, outputs)
+        np.multiply(outputs, output_deltas, out=output_deltas)
+        np.multiply(output_errors, output_deltas, out=output_deltas)
+        
+        # Hidden deltas: errors * hidden * (1 - hidden)
+        hidden_deltas = np.subtract(1.0, self.hidden_outputs)
+        np.multiply(self.hidden_outputs, hidden_deltas, out=hidden_deltas)
+        np.multiply(hidden_errors, hidden_deltas, out=hidden_deltas)
+        
         # Update weights and biases
         # Output layer
-        self.weights_hidden_output += self.learning_rate * np.dot(
-            self.hidden_outputs.T, 
-            output_errors * self.sigmoid_derivative(outputs)
-        )
-        self.bias_output += self.learning_rate * np.sum(
-            output_errors * self.sigmoid_derivative(outputs), 
-            axis=0
-        )
+        self.weights_hidden_output += self.learning_rate * np.dot(self.hidden_outputs.T, output_deltas)
+        self.bias_output += self.learning_rate * np.sum(output_deltas, axis=0)
         
         # Hidden layer
-        self.weights_input_hidden += self.learning_rate * np.dot(
-            np.array(inputs, ndmin=2).T, 
-            hidden_errors * self.sigmoid_derivative(self.hidden_outputs)
-        )
-        self.bias_hidden += self.learning_rate * np.sum(
-            hidden_errors * self.sigmoid_derivative(self.hidden_outputs), 
-            axis=0
-        )
+        self.weights_input_hidden += self.learning_rate * np.dot(inputs.T, hidden_deltas)
+        self.bias_hidden += self.learning_rate * np.sum(hidden_deltas, axis=0)
     
-    def save(self, filename):
-        """Save network weights and biases to file"""
-        np.savez(
-            filename, 
-            w_input_hidden=self.weights_input_hidden,
-            w_hidden_output=self.weights_hidden_output,
-            b_hidden=self.bias_hidden,
-            b_output=self.bias_output
-        )
+    def save(self, dirpath):
+        """Save network weights and biases as one .npy file per array"""
+        os.makedirs(dirpath, exist_ok=True)
+        for filename, attr in WEIGHT_FILES:
+            np.save(os.path.join(dirpath, filename), getattr(self, attr))
     
-    def load(self, filename):
-        """Load network weights and biases from file"""
-        data = np.load(filename)
-        self.weights_input_hidden = data['w_input_hidden']
-        self.weights_hidden_output = data['w_hidden_output']
-        self.bias_hidden = data['b_hidden']
-        self.bias_output = data['b_output']
+    def load(self, dirpath, mmap=True):
+        """Load network weights and biases saved by save()
+        
+        With mmap=True the arrays are memory-mapped copy-on-write, so networks
+        loaded from the same directory share pages until one of them trains.
+        """
+        for filename, attr in WEIGHT_FILES:
+            array = np.load(os.path.join(dirpath, filename), mmap_mode='c' if mmap else None)
+            # Plain ndarray view over the mapping, so compiled kernels accept it
+            setattr(self, attr, array.view(np.ndarray))
 
 
 class DQNetwork:
@@ -106,77 +319,92 @@ class DQNetwork:
         self.target_network = NeuralNetwork(state_size, hidden_size, action_size, learning_rate)
         
         # Sync target with main network initially
+        self._blend_bufs = None
         self.update_target_network()
         
+        # One-hot lookup rows and the reusable single-state input row
+        self._eye = np.eye(3, dtype=np.float32)
+        self._state_buf = np.zeros((1, state_size), dtype=np.float32)
+        
         # Hyperparameters
         self.gamma = 0.95  # discount factor
         self.epsilon = 1.0  # exploration rate
         self.epsilon_min = 0.01
         self.epsilon_decay = 0.995
+        
+        # Use the exp-free hidden activation when selecting actions (pure-inference runs)
+        self.approximate_inference = False
     
-    def update_target_network(self):
-        """Update target network with weights from main network"""
-        self.target_network.weights_input_hidden = self.main_network.weights_input_hidden.copy()
-        self.target_network.weights_hidden_output = self.main_network.weights_hidden_output.copy()
-        self.target_network.bias_hidden = self.main_network.bias_hidden.copy()
-        self.target_network.bias_output = self.main_network.bias_output.copy()
+    def update_target_network(self, tau: float = 1.0):
+        """Blend main network weights into the target network in place
+        
+        tau=1.0 is a hard copy; smaller values give a Polyak soft update
+        (target = tau * main + (1 - tau) * target).
+        """
+        pairs = [
+            (self.target_network.weights_input_hidden, self.main_network.weights_input_hidden),
+            (self.target_network.weights_hidden_output, self.main_network.weights_hidden_output),
+            (self.target_network.bias_hidden, self.main_network.bias_hidden),
+            (self.target_network.bias_output, self.main_network.bias_output),
+        ]
+        
+        if tau >= 1.0:
+            for target, main in pairs:
+                np.copyto(target, main)
+            return
+        
+        # Scratch buffers for tau * main, allocated on the first soft update
+        if self._blend_bufs is None:
+            self._blend_bufs = [np.empty_like(main) for _, main in pairs]
+        
+        for (target, main), scratch in zip(pairs, self._blend_bufs):
+            np.multiply(main, tau, out=scratch)
+            target *= (1.0 - tau)
+            target += scratch
     
-    def encode_state(self, state_dict: Dict[str, Any]) -> List[float]:
-        """Convert state dictionary to neural network input vector"""
-        encoded = []
-        
-        # Encode energy level
-        if state_dict.get('energy') == 'low':
-            encoded.extend([1.0, 0.0, 0.0])
-        elif state_dict.get('energy') == 'medium':
-            encoded.extend([0.0, 1.0, 0.0])
-        else:  # high
-            encoded.extend([0.0, 0.0, 1.0])
-            
-        # Encode money level
-        if state_dict.get('money') == 'low':
-            encoded.extend([1.0, 0.0, 0.0])
-        elif state_dict.get('money') == 'medium':
-            encoded.extend([0.0, 1.0, 0.0])
-        else:  # high
-            encoded.extend([0.0, 0.0, 1.0])
-            
-        # Encode mood level
-        if state_dict.get('mood') == 'negative':
-            encoded.extend([1.0, 0.0, 0.0])
-        elif state_dict.get('mood') == 'neutral':
-            encoded.extend([0.0, 1.0, 0.0])
-        else:  # positive
-            encoded.extend([0.0, 0.0, 1.0])
-            
-        # Encode corruption level
-        if state_dict.get('corruption') == 'low':
-            encoded.extend([1.0, 0.0, 0.0])
-        elif state_dict.get('corruption') == 'medium':
-            encoded.extend([0.0, 1.0, 0.0])
-        else:  # high
-            encoded.extend([0.0, 0.0, 1.0])
-            
-        # Encode food reserves level
-        if state_dict.get('food_reserves') == 'low':
-            encoded.extend([1.0, 0.0, 0.0])
-        elif state_dict.get('food_reserves') == 'medium':
-            encoded.extend([0.0, 1.0, 0.0])
-        else:  # high
-            encoded.extend([0.0, 0.0, 1.0])
-            
-        # Encode farm knowledge (0 for no knowledge, 1 for knowledge)
-        encoded.append(1.0 if state_dict.get('knows_farm_location', False) else 0.0)
-        encoded.append(1.0 if state_dict.get('knows_yield_farm', False) else 0.0)
+    def encode_state(self, state_dict: Dict[str, Any]) -> np.ndarray:
+        """Convert state dictionary to a (1, state_size) network input row
+        
+        The returned row is a reused buffer; copy it if it must outlive the next call.
+        """
+        encoded = self._state_buf
+        
+        # One-hot level features (energy, money, mood, corruption, food reserves)
+        for feature, (key, levels) in enumerate(LEVEL_FEATURES):
+            encoded[0, feature * 3:feature * 3 + 3] = self._eye[levels.get(state_dict.get(key), 2)]
+        
+        # Farm, workplace and trading knowledge (0 for none, 1 for known)
+        for column, key in enumerate(FLAG_FEATURES, start=len(LEVEL_FEATURES) * 3):
+            encoded[0, column] = 1.0 if state_dict.get(key, False) else 0.0
         
-        # Encode workplace knowledge
-        encoded.append(1.0 if state_dict.get('knows_workplace', False) else 0.0)
+        return encoded
+    
+    def encode_states(self, state_dicts: List[Dict[str, Any]]) -> np.ndarray:
+        """Convert a list of state dictionaries to an (N, state_size) input matrix"""
+        count = len(state_dicts)
+        encoded = np.zeros((count, self.state_size), dtype=np.float32)
+        rows = np.arange(count)
         
-        # Encode social factors (0 for no social connections, 1 for active connections)
-        encoded.append(1.0 if state_dict.get('has_trading_partners', False) else 0.0)
+        # One-hot level features, set with a single fancy-indexed assignment each
+        for feature, (key, levels) in enumerate(LEVEL_FEATURES):
+            level_idx = np.fromiter(
+                (levels.get(state.get(key), 2) for state in state_dicts),
+                dtype=np.intp, count=count
+            )
+            encoded[rows, feature * 3 + level_idx] = 1.0
+        
+        # Boolean knowledge/social flags
+        for column, key in enumerate(FLAG_FEATURES, start=len(LEVEL_FEATURES) * 3):
+            encoded[:, column] = [1.0 if state.get(key, False) else 0.0 for state in state_dicts]
         
         return encoded
     
+    def _action_index(self, action) -> int:
+        """Convert a string action to its output index (integers pass through)"""
+        if isinstance(action, str):
+            return ACTION_INDICES.get(action, 0)  # Default to 0 if unknown
+        return action
+    
     def select_action(self, state: Dict[str, Any], exploration_rate: float = None) -> int:
         """Select action using epsilon-greedy policy"""
         if exploration_rate is None:
@@ -188,15 +416,16 @@ class DQNetwork:
             # Convert state to network input
             state_vector = self.encode_state(state)
             
-            # Get Q-values from network
-            q_values = self.main_network.forward(state_vector)
+            # Get Q-value pre-activations from network (same ranking as the sigmoid outputs)
+            q_values = self.main_network.forward_for_argmax(state_vector, approximate=self.approximate_inference)
             
             # Return action with highest Q-value
             return np.argmax(q_values)
     
     def train(self, state, action, reward, next_state, done):
         """Train the network with a single experience"""
-        state_vector = self.encode_state(state)
+        # Copy the first row out, since encode_state reuses its buffer
+        state_vector = self.encode_state(state).copy()
         next_state_vector = self.encode_state(next_state)
         
         # Get current Q values
@@ -209,17 +438,7 @@ class DQNetwork:
         target = current_q.copy()
         
         # Ensure action is an integer index
-        if isinstance(action, str):
-            # Convert string action to index if needed
-            action_idx_map = {
-                'eat': 0, 'work': 1, 'rest': 2, 'mate': 3, 'search': 4,
-                'plant-food': 5, 'harvest-food': 6, 'gift-food': 7, 'gift-money': 8,
-                'invest': 9, 'buy-food': 10, 'sell-food': 11,
-                'trade-food-for-money': 12, 'trade-money-for-food': 13
-            }
-            action_idx = action_idx_map.get(action, 0)  # Default to 0 if unknown
-        else:
-            action_idx = action
+        action_idx = self._action_index(action)
         
         if done:
             target[0][action_idx] = reward
@@ -241,24 +460,33 @@ class DQNetwork:
         # Get Q-values from main network
         q_values = self.main_network.forward(state_vector)
         
-        # Return the raw values
-        return q_values[0]  # Return the first (and only) row of outputs
+        # Return the raw values - copied, since forward reuses its output buffer
+        return q_values[0].copy()  # Return the first (and only) row of outputs
 
     def train_batch(self, experiences):
-        """Train network with a batch of experiences"""
+        """Train network with a batch of experiences in one forward/backward pass"""
         if not experiences:
             return
         
-        # Process a batch of experiences
-        for exp in experiences:
-            state = exp.state
-            action = exp.action
-            reward = exp.reward
-            next_state = exp.next_state
-            done = exp.done
-            
-            # Train with individual experience
-            self.train(state, action, reward, next_state, done)
+        batch_size = len(experiences)
+        
+        # Stack the batch into (N, state_size) matrices
+        state_matrix = self.encode_states([exp.state for exp in experiences])
+        next_state_matrix = self.encode_states([exp.next_state for exp in experiences])
+        actions = np.fromiter((self._action_index(exp.action) for exp in experiences), dtype=np.intp, count=batch_size)
+        rewards = np.fromiter((exp.reward for exp in experiences), dtype=float, count=batch_size)
+        dones = np.fromiter((exp.done for exp in experiences), dtype=float, count=batch_size)
+        
+        # Get current Q values and next Q values from target network
+        current_q = self.main_network.forward(state_matrix)
+        next_q = self.target_network.forward(next_state_matrix)
+        
+        # Update targets for the taken actions only
+        targets = current_q.copy()
+        targets[np.arange(batch_size), actions] = rewards + self.gamma * np.max(next_q, axis=1) * (1.0 - dones)
+        
+        # Train the main network on the whole batch
+        self.main_network.train(state_matrix, targets)
         
-        # After batch is processed, update target network if needed
-        return
+        # Decay epsilon once per experience, as per-sample training did
+        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay ** batch_size)
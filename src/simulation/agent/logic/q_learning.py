@@ -1,7 +1,29 @@
 # Q learning is used to handle the reinforcement learning aspect of the simulation
+from enum import IntEnum
 from typing import Dict, List, Tuple, Optional
 import random
 
+class Action(IntEnum):
+    """Integer action IDs, in the dict Q-table key order"""
+    EAT = 0
+    WORK = 1
+    REST = 2
+    MATE = 3
+    SEARCH = 4
+    PLANT_FOOD = 5
+    HARVEST_FOOD = 6
+    GIFT_FOOD = 7
+    GIFT_MONEY = 8
+    INVEST = 9
+    BUY_FOOD = 10
+    SELL_FOOD = 11
+    TRADE_FOOD_FOR_MONEY = 12
+    TRADE_MONEY_FOR_FOOD = 13
+
+# Action names by ID, as used for the dict Q-table keys
+ACTIONS = [action.name.lower().replace('_', '-') for action in Action]
+ACTION_IDS = {name: Action(code) for code, name in enumerate(ACTIONS)}
+
 class QLearningSystem:
     def __init__(self, learning_rate=0.1, discount_factor=0.9, exploration_rate=0.1):
         self.learning_rate = learning_rate
@@ -79,4 +101,4 @@ class QLearningSystem:
         new_q = current_q + learning_rate * (reward + self.discount_factor * max_next_q - current_q)
         q_table[state][action] = new_q
         
-        return q_table
\ No newline at end of file
+        return q_table
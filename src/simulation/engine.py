@@ -69,5 +69,6 @@ class Simulation:
             pygame.display.flip()
             self.clock.tick(60)
             
+        self.world.shutdown()
         pygame.quit()
         sys.exit()
\ No newline at end of file
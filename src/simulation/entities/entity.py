@@ -9,6 +9,9 @@ from ...core.assets.animation import Animation
 from ...core.assets.manager import AssetManager
 from constants import EntityType, asset_map, additional_assets
 
+# Shared asset cache - every entity loads through the same manager
+_ASSET_MANAGER = AssetManager()
+
 class Entity:
     position: Tuple[int, int]
     size: Tuple[int, int] = (64, 64)
@@ -28,7 +31,7 @@ class Entity:
         self.stateful_assets = [k for k, v in asset_map[self.entity_type].items() if k in ["eat", "mate", "work", "rest", "dead"]]
         self.additional_assets = additional_assets.get(self.entity_type, {})
         self.assets = {}
-        self.asset_manager = AssetManager()
+        self.asset_manager = _ASSET_MANAGER
         
         self.load_asset(asset_map[self.entity_type].get("name"), self.default_asset)
 
@@ -43,6 +46,7 @@ class Entity:
             )
             
         self.scale_asset(self.entity_type.value, self.size[0], self.size[1])
+        self._refresh_animations()
         
     def load_asset(self, name, image_path):
         self.assets[name] = self.asset_manager.get_asset(image_path)
@@ -51,6 +55,7 @@ class Entity:
     def load_animation(self, name, pattern, frame_count, frame_delay=10):
         image_paths = [pattern.format(i) for i in range(1, frame_count + 1)]
         self.assets[name] = self.asset_manager.get_animation(image_paths, frame_delay)
+        self._refresh_animations()
         return self.assets[name]
         
     def get_asset(self, name):
@@ -72,15 +77,14 @@ class Entity:
             self.assets[asset_name] = self.asset_manager.get_scaled_animation(
                 paths, width, height, asset.frame_delay
             )
+            self._refresh_animations()
         else:
-            # For normal assets, we need the original path
-            # In a real impl we'd store the path in the Asset class
-            for path, stored_asset in self.asset_manager.assets.items():
-                if stored_asset == asset:
-                    self.assets[asset_name] = self.asset_manager.get_scaled_asset(
-                        path, width, height
-                    )
-                    break
+            # For normal assets, rescale from the original path stored on the asset
+            path = getattr(asset, 'source_path', None)
+            if path is not None:
+                self.assets[asset_name] = self.asset_manager.get_scaled_asset(
+                    path, width, height
+                )
                     
         return self.assets[asset_name]
 
@@ -90,10 +94,13 @@ class Entity:
             if asset.visible:
                 asset.render(self.screen)
             
+    def _refresh_animations(self):
+        """Cache the Animation assets so per-frame updates skip static assets"""
+        self._animations = [asset for asset in self.assets.values() if isinstance(asset, Animation)]
+            
     def update_animations(self):
-        for asset in self.assets.values():
-            if isinstance(asset, Animation):
-                asset.update()
+        for animation in self._animations:
+            animation.update()
 
     def position_asset(self, asset_name, x, y):
         asset = self.assets[asset_name]
@@ -62,7 +62,7 @@ class EntityFactory:
         self._add_standard_components(entity, entity_id, tag_value)
         
         # Add entity to spatial grid
-        self.spatial_grid.insert(entity_id, position[0], position[1])
+        self.spatial_grid.insert(entity_id, position[0], position[1], tag_value)
         
         return entity
     
@@ -198,7 +198,7 @@ class EntityFactory:
         self._add_standard_components(entity, entity_id, tag_value)
         
         # Add entity to spatial grid
-        self.spatial_grid.insert(entity_id, entity.position[0], entity.position[1])
+        self.spatial_grid.insert(entity_id, entity.position[0], entity.position[1], tag_value)
         
         # Set reference to the world
         if hasattr(self, 'world'):
@@ -3,9 +3,41 @@ from typing import Tuple, Optional, Any
 from ..entity import Entity
 from constants import EntityType, Gender, ActionType, asset_map
 from src.simulation.genetics.genome import Genome
+from src.simulation.agent.logic.q_learning import Action, ACTIONS
 import random
 import pygame
 
+# Per-agent values kept in the world's agent metrics store (see Agent.bind_metrics)
+METRIC_FIELDS = [
+    ('age', 'f8'), ('energy', 'f8'), ('money', 'f8'), ('mood', 'f8'),
+    ('alive', 'u1'), ('action', 'u1'), ('decay', 'f8')
+]
+
+# Actions counted by the world metrics (their codes are their Action IDs); any other
+# action is stored as len(METRIC_ACTIONS). Both the names and the Action values map.
+METRIC_ACTIONS = ACTIONS[:Action.SEARCH + 1]
+_ACTION_CODES = {action: code for code, action in enumerate(METRIC_ACTIONS)}
+_ACTION_CODES.update({Action(code): code for code in range(len(METRIC_ACTIONS))})
+
+def _metric_property(name, field, cast):
+    """Attribute held on the agent until it is bound, then in its metrics store row"""
+    private = '_' + name
+    
+    def getter(self):
+        store = self._metrics
+        if store is None:
+            return getattr(self, private)
+        return cast(store.columns[field][store.id_to_row[id(self)]])
+    
+    def setter(self, value):
+        store = self._metrics
+        if store is None:
+            setattr(self, private, value)
+            return
+        store.columns[field][store.id_to_row[id(self)]] = value
+    
+    return property(getter, setter)
+
 @dataclass
 class Agent(Entity):
     is_alive: bool
@@ -26,6 +58,7 @@ class Agent(Entity):
     corruption_level: float = 0.0  # Added corruption level for tracking agent's behavior
 
     def __init__(self, idx: int, screen: pygame.Surface):
+        self._metrics = None
         self.is_alive = True
         gender = random.choice([Gender.MALE, Gender.FEMALE])
         self.genome = Genome(gender, idx)
@@ -72,6 +105,7 @@ class Agent(Entity):
         """Clear any references that might cause memory leaks"""
         # Reset attributes that might hold references
         self.assets = {}
+        self._animations = []
         if hasattr(self, 'target'):
             self.target = None
 
@@ -91,7 +125,30 @@ class Agent(Entity):
     @current_action.setter
     def current_action(self, value):
         self._current_action = value
+        if self._metrics is not None:
+            store = self._metrics
+            store.columns['action'][store.id_to_row[id(self)]] = _ACTION_CODES.get(value, len(METRIC_ACTIONS))
         # We'll update visibility directly in the update method
+    
+    def bind_metrics(self, store):
+        """Move age/vitals/action into a metrics store row, keyed by id(self)"""
+        values = (self.age, self.energy, self.money, self.mood, self.is_alive, self.current_action)
+        store.add(id(self))
+        self._metrics = store
+        self.age, self.energy, self.money, self.mood, self.is_alive, self.current_action = values
+        
+        # Genome traits are fixed once the agent exists, so its base energy decay is too
+        store.columns['decay'][store.id_to_row[id(self)]] = self.genome.metabolism / self.genome.stamina
+    
+    def unbind_metrics(self):
+        """Copy the stored values back onto the agent and free its store row"""
+        store = self._metrics
+        if store is None:
+            return
+        values = (self.age, self.energy, self.money, self.mood, self.is_alive)
+        self._metrics = None
+        self.age, self.energy, self.money, self.mood, self.is_alive = values
+        store.remove(id(self))
 
     def preload_state_assets(self):
         """Preload all possible state assets for this entity type"""
@@ -111,3 +168,8 @@ class Agent(Entity):
         # Scale all loaded assets to the entity's size
         for asset_name in list(self.assets.keys()):
             self.scale_asset(asset_name, self.size[0], self.size[1])
+
+# Metric attributes are attached after the dataclass is built, so they don't become field defaults
+for _name, _field, _cast in [('age', 'age', int), ('energy', 'energy', float), ('money', 'money', float),
+                             ('mood', 'mood', float), ('is_alive', 'alive', bool)]:
+    setattr(Agent, _name, _metric_property(_name, _field, _cast))
@@ -36,3 +36,4 @@ class Farm(Entity):
     def clear_references(self):
         """Clear any references that might cause memory leaks"""
         self.assets = {}
+        self._animations = []
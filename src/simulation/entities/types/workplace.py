@@ -54,4 +54,5 @@ class WorkPlace(Entity):
     
     def clear_references(self):
         """Clear any references that might cause memory leaks"""
-        self.assets = {}
\ No newline at end of file
+        self.assets = {}
+        self._animations = []
\ No newline at end of file
@@ -39,13 +39,23 @@ class Evolution:
         # Create new epoch
         new_population = []
         
-        # Add offspring from elite performers
-        for i in range(elite_count):
-            # Select parents based on fitness
-            parent1, parent2 = self._select_parents(previous_population, fitness_scores)
-            
-            # Create offspring
-            offspring = self._create_offspring(parent1, parent2, len(new_population), world)
+        # Add offspring from elite performers - parents for every child are
+        # selected, then crossed over, as whole-generation batches
+        totals = np.array([fitness_scores[agent.id]['total'] for agent in previous_population])
+        parents1, parents2 = self._select_parents(totals, elite_count)
+        child_genomes = Genome.crossover_batch(
+            [previous_population[i].genome for i in parents1.tolist()],
+            [previous_population[i].genome for i in parents2.tolist()]
+        )
+        
+        # Each child is one generation past its newer parent
+        generations = np.array([agent.generation for agent in previous_population])
+        child_generations = np.maximum(generations[parents1], generations[parents2]) + 1
+        
+        for genome, generation in zip(child_genomes, child_generations.tolist()):
+            offspring = Agent(len(new_population), world.world_screen)
+            offspring.genome = genome
+            offspring.generation = generation
             new_population.append(offspring)
         
         # Add random new agents
@@ -107,30 +117,22 @@ class Evolution:
             
         return fitness_scores
     
-    def _select_parents(self, population: List[Agent], fitness_scores: Dict[int, Dict[str, float]]) -> Tuple[Agent, Agent]:
-        """Select parents using tournament selection"""
-        tournament_size = min(4, len(population))
-        
-        # Tournament for first parent
-        candidates1 = random.sample(population, tournament_size)
-        parent1 = max(candidates1, key=lambda agent: fitness_scores[agent.id]['total'])
-        
-        # Tournament for second parent
-        candidates2 = random.sample(population, tournament_size)
-        parent2 = max(candidates2, key=lambda agent: fitness_scores[agent.id]['total'])
-        
-        return parent1, parent2
-    
-    def _create_offspring(self, parent1: Agent, parent2: Agent, idx: int, world) -> Agent:
-        """Create offspring from two parents"""
-        # Create new genome by crossover
-        child_genome = Genome.crossover(parent1.genome, parent2.genome)
-        
-        # Create new agent
-        child = Agent(idx, world.world_screen)
-        child.genome = child_genome
-        
-        return child
+    def _select_parents(self, totals: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Select count pairs of parent indices using tournament selection"""
+        tournament_size = min(4, len(totals))
+        
+        # Draw candidates directly, redrawing any tournament that picked someone twice
+        # so candidates stay distinct as with random.sample
+        candidates = np.random.randint(0, len(totals), size=(2 * count, tournament_size))
+        while tournament_size > 1:
+            ordered = np.sort(candidates, axis=1)
+            repeats = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            if not repeats.any():
+                break
+            candidates[repeats] = np.random.randint(0, len(totals), size=(int(repeats.sum()), tournament_size))
+        winners = candidates[np.arange(2 * count), totals[candidates].argmax(axis=1)]
+        
+        return winners[:count], winners[count:]
     
     def _apply_mutations(self, population: List[Agent]) -> None:
         """Apply mutations to a random subset of the population"""
@@ -139,10 +141,10 @@ class Evolution:
         # Select random agents to mutate
         agents_to_mutate = random.sample(population, mutation_count)
         
+        # Apply genome mutation to all of them at once
+        Genome.mutate_batch([agent.genome for agent in agents_to_mutate], mutation_rate=0.2)
+        
         for agent in agents_to_mutate:
-            # Apply genome mutation
-            agent.genome.mutate(mutation_rate=0.2)
-            
             # Occasionally cause bigger mutations
             if random.random() < 0.1:
                 # More significant mutation to a randomly selected trait
@@ -1,10 +1,20 @@
 from typing import Dict, List, Tuple, Optional
 import random
+import numpy as np
 from ..agent.logic.q_learning import QLearningSystem
 from constants import Gender
 
 # Genome is used to represent the genetic information of an agent and it's evolution
 
+# Numeric traits, in the column order used by the batched crossover/mutation
+TRAITS = ['metabolism', 'stamina', 'learning_capacity', 'attraction_profile', 'sexual_preference', 'corruption']
+
+# Per-trait mutation step (uniform +/-step) and clamp range; corruption has its own skewed step
+_MUTATION_STEPS = np.array([0.2, 0.2, 0.1, 0.3, 0.2, 0.0])
+_TRAIT_MIN = np.array([0.1, 0.1, 0.05, -1.0, 0.0, 0.0])
+_TRAIT_MAX = np.array([2.0, 2.0, 1.0, 1.0, 1.0, 1.0])
+_CORRUPTION = TRAITS.index('corruption')
+
 class Genome:
     def __init__(self, gender=None, idx=None):
         if gender is None:
@@ -33,83 +43,102 @@ class Genome:
         q_learning = QLearningSystem()
         self.q_table = q_learning.initialize_q_table()
     
+    @staticmethod
+    def trait_matrix(genomes) -> np.ndarray:
+        """Stack the numeric traits of several genomes into a (len(genomes), len(TRAITS)) array"""
+        return np.array([[getattr(genome, name) for name in TRAITS] for genome in genomes], dtype=np.float64)
+    
+    def set_traits(self, values):
+        """Set the numeric traits from one row of a trait matrix"""
+        for name, value in zip(TRAITS, values.tolist()):
+            setattr(self, name, value)
+    
     @classmethod
     def crossover(cls, parent1, parent2):
         """Create a new genome by crossing over two parent genomes"""
-        child = cls()
-        
-        # Randomly inherit gender (slightly biased toward biological balance)
-        child.gender = random.choice([parent1.gender, parent2.gender])
+        return cls.crossover_batch([parent1], [parent2])[0]
+    
+    @classmethod
+    def crossover_batch(cls, parents1, parents2):
+        """Create one child genome per pair of parents, mixing all their traits at once"""
+        count = len(parents1)
+        traits1 = cls.trait_matrix(parents1)
+        traits2 = cls.trait_matrix(parents2)
         
-        # Crossover inherited traits
-        child.metabolism = random.choice([parent1.metabolism, parent2.metabolism])
-        child.stamina = random.choice([parent1.stamina, parent2.stamina])
-        child.learning_capacity = random.choice([parent1.learning_capacity, parent2.learning_capacity])
-        child.attraction_profile = random.choice([parent1.attraction_profile, parent2.attraction_profile])
-        child.sexual_preference = random.choice([parent1.sexual_preference, parent2.sexual_preference])
+        # One coin per child and trait, plus one each for gender and learning method
+        picks = np.random.random((count, len(TRAITS) + 2)) < 0.5
+        traits = np.where(picks[:, :len(TRAITS)], traits1, traits2)
         
         # Inherit corruption with slight increase from parents (corruption tends to grow)
-        parent_corruption = random.choice([parent1.corruption, parent2.corruption])
-        child.corruption = min(1.0, parent_corruption * random.uniform(0.9, 1.1))
+        traits[:, _CORRUPTION] = np.minimum(1.0, traits[:, _CORRUPTION] * np.random.uniform(0.9, 1.1, count))
         
-        # Inherit partial q-table (representing learned behavior)
-        child.q_table = {}
-        # Mix parent Q-tables (inheriting some knowledge)
-        for state in set(parent1.q_table.keys()) | set(parent2.q_table.keys()):
-            if state in parent1.q_table and state in parent2.q_table:
-                child.q_table[state] = {}
-                for action in parent1.q_table[state]:
+        children = []
+        for i, (parent1, parent2) in enumerate(zip(parents1, parents2)):
+            child = cls()
+            child.set_traits(traits[i])
+            child.gender = parent1.gender if picks[i, -2] else parent2.gender
+            
+            # Inherit partial q-tables (representing learned behavior)
+            child.q_table = cls._crossover_q_tables(parent1.q_table, parent2.q_table)
+            
+            # Inherit neural network learning method
+            child.use_neural_network = parent1.use_neural_network if picks[i, -1] else parent2.use_neural_network
+            children.append(child)
+        
+        return children
+    
+    @staticmethod
+    def _crossover_q_tables(q_table1, q_table2):
+        """Mix parent Q-tables, taking each shared Q-value from either parent"""
+        q_table = {}
+        for state in set(q_table1.keys()) | set(q_table2.keys()):
+            if state in q_table1 and state in q_table2:
+                q_table[state] = {}
+                for action in q_table1[state]:
                     # Inherit the better learned action values (with some noise)
                     if random.random() < 0.5:
-                        child.q_table[state][action] = parent1.q_table[state][action]
+                        q_table[state][action] = q_table1[state][action]
                     else:
-                        child.q_table[state][action] = parent2.q_table[state][action]
-            elif state in parent1.q_table:
-                child.q_table[state] = parent1.q_table[state].copy()
+                        q_table[state][action] = q_table2[state][action]
+            elif state in q_table1:
+                q_table[state] = q_table1[state].copy()
             else:
-                child.q_table[state] = parent2.q_table[state].copy()
-        
-        # Inherit neural network learning method
-        child.use_neural_network = random.choice([parent1.use_neural_network, parent2.use_neural_network])
-        
-        return child
+                q_table[state] = q_table2[state].copy()
+        return q_table
     
     def mutate(self, mutation_rate=0.1):
         """Apply random mutations to genome"""
-        if random.random() < mutation_rate:
-            self.metabolism += random.uniform(-0.2, 0.2)
-            self.metabolism = max(0.1, min(2.0, self.metabolism))
-            
-        if random.random() < mutation_rate:
-            self.stamina += random.uniform(-0.2, 0.2)
-            self.stamina = max(0.1, min(2.0, self.stamina))
-            
-        if random.random() < mutation_rate:
-            self.learning_capacity += random.uniform(-0.1, 0.1)
-            self.learning_capacity = max(0.05, min(1.0, self.learning_capacity))
-            
-        if random.random() < mutation_rate:
-            self.attraction_profile += random.uniform(-0.3, 0.3)
-            self.attraction_profile = max(-1.0, min(1.0, self.attraction_profile))
-            
-        if random.random() < mutation_rate:
-            self.sexual_preference += random.uniform(-0.2, 0.2)
-            self.sexual_preference = max(0.0, min(1.0, self.sexual_preference))
-
-        if random.random() < mutation_rate:
-            # Corruption can mutate up or down, but weighted toward increase
-            if random.random() < 0.7:  # 70% chance to increase
-                self.corruption += random.uniform(0, 0.2)
-            else:  # 30% chance to decrease
-                self.corruption -= random.uniform(0, 0.1)
-            self.corruption = max(0.0, min(1.0, self.corruption))
+        Genome.mutate_batch([self], mutation_rate)
+    
+    @staticmethod
+    def mutate_batch(genomes, mutation_rate=0.1):
+        """Apply random mutations to several genomes, drawing all trait changes at once"""
+        count = len(genomes)
+        traits = Genome.trait_matrix(genomes)
+        
+        # Each trait mutates independently with probability mutation_rate
+        mutating = np.random.random(traits.shape) < mutation_rate
+        steps = np.random.uniform(-1.0, 1.0, traits.shape) * _MUTATION_STEPS
         
-        # Occasionally mutate a random Q-value to encourage exploration
-        if random.random() < mutation_rate and self.q_table:
-            state = random.choice(list(self.q_table.keys()))
-            action = random.choice(list(self.q_table[state].keys()))
-            self.q_table[state][action] += random.uniform(-0.5, 0.5)
+        # Corruption can mutate up or down, but weighted toward increase (70%)
+        steps[:, _CORRUPTION] = np.where(
+            np.random.random(count) < 0.7,
+            np.random.uniform(0, 0.2, count),
+            -np.random.uniform(0, 0.1, count)
+        )
+        traits = np.where(mutating, np.clip(traits + steps, _TRAIT_MIN, _TRAIT_MAX), traits)
         
-        # Occasionally flip this trait during mutation
-        if random.random() < mutation_rate:
-            self.use_neural_network = not self.use_neural_network
\ No newline at end of file
+        # Q-value and learning method mutations, one roll each per genome
+        rolls = np.random.random((count, 2)) < mutation_rate
+        for genome, row, (mutate_q, flip) in zip(genomes, traits, rolls.tolist()):
+            genome.set_traits(row)
+            
+            # Occasionally mutate a random Q-value to encourage exploration
+            if mutate_q and genome.q_table:
+                state = random.choice(list(genome.q_table.keys()))
+                action = random.choice(list(genome.q_table[state].keys()))
+                genome.q_table[state][action] += random.uniform(-0.5, 0.5)
+            
+            # Occasionally flip this trait during mutation
+            if flip:
+                genome.use_neural_network = not genome.use_neural_network
@@ -1,8 +1,17 @@
 from ..genetics.genome import Genome
-from ..agent.logic.q_learning import QLearningSystem
+from ..agent.logic.q_learning import QLearningSystem, Action, ACTION_IDS
 from ..entities.types.agent import Agent
 from ..agent.logic.brain import AgentBrain
 from ..genetics.evolution import Evolution
+from src.core.ecs.core import ComponentID
+from constants import Gender
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Exploration rate by age, 0.1 / (1 + age/100), looked up instead of divided per agent per tick.
+# Agents die past age 100, so older ages just reuse the last entry.
+_MAX_EXPLORATION_AGE = 199
+_EXPLORATION = (0.1 / (1.0 + np.arange(0, _MAX_EXPLORATION_AGE + 1) / 100.0)).astype(np.float32)
 
 # Population is a collection of agents that interact with the world and other agents
 
@@ -19,16 +28,54 @@ class Population:
             'deaths_this_epoch': 0,
             'births_this_epoch': 0
         }
+        self.male_count = 0  # Kept in step with add/remove so metrics needn't scan genomes
         self.q_learning_system = QLearningSystem()
         self.evolution = Evolution(self.world.population_size, mutation_rate=0.1, elite_percentage=0.5)
+        
+        # Threads for the per-agent Q-learning phases of update(); 1 runs them inline.
+        # Dict Q-tables hold the GIL, so threads only pay off once that work is in NumPy.
+        self.workers = 1
+        self._executor = None
     
     def initialize_population(self, size):
         """Initialize starting population with random agents"""
         for i in range(size):
             agent = self.create_agent(i)
-            self.population.append(agent)
+            self.add_agent(agent)
             self.world.add_entity(agent)
     
+    def add_agent(self, agent):
+        """Add an agent to the population and move its vitals into the world metrics store
+        
+        Both the list and the store append and swap-pop together, so
+        population[i] always owns metrics row i.
+        """
+        agent._population_idx = len(self.population)
+        self.population.append(agent)
+        agent.bind_metrics(self.world.agent_metrics)
+        if agent.genome.gender == Gender.MALE:
+            self.male_count += 1
+    
+    def remove_agent(self, agent):
+        """Remove an agent from the population and free its metrics row
+        
+        The last agent is swapped into the freed slot, so population order is not kept.
+        """
+        last = self.population.pop()
+        if last is not agent:
+            self.population[agent._population_idx] = last
+            last._population_idx = agent._population_idx
+        agent.unbind_metrics()
+        if agent.genome.gender == Gender.MALE:
+            self.male_count -= 1
+    
+    def clear_agents(self):
+        """Remove every agent, keeping their last values on the agent objects"""
+        for agent in self.population:
+            agent.unbind_metrics()
+        self.population = []
+        self.male_count = 0
+    
     def create_agent(self, idx, parent1=None, parent2=None):
         """Create a new agent, either randomly or from parents"""
         if parent1 and parent2:
@@ -65,27 +112,51 @@ class Population:
     
     def update(self):
         """Update society state, handle agent interactions and learning"""
-        # Process agent interactions and actions
-        agents_to_remove = []
+        # Phase 1: observe and select actions - per-agent only, so it can run in parallel
+        agents = list(self.population)
+        store = self.world.agent_metrics
+        ages = np.minimum(store.column('age'), _MAX_EXPLORATION_AGE).astype(np.intp)
+        choices = self._map_agents(self._select_actions, list(zip(agents, _EXPLORATION[ages].tolist())))
         
-        for agent in self.population:
-            # Get current state
-            state = agent.get_state_representation()
+        # Phase 2: execute actions one agent at a time, since they mutate shared world state
+        outcomes = []
+        for agent, (state, action) in zip(agents, choices):
+            reward = self.execute_action(agent, ACTION_IDS[action])
+            outcomes.append((agent, state, action, reward, agent.get_state_representation()))
+        
+        # Phase 3: update each agent's own Q-table - independent, so parallel again
+        self._map_agents(self._update_q_tables, outcomes)
             
-            # Select action using Q-learning
+        # Age every agent and apply base energy consumption in one pass over the metrics columns
+        store.column('age')[:] += 1
+        store.column('energy')[:] -= store.column('decay')
+        
+        # Check for death conditions across the whole population at once
+        dead_mask = (store.column('energy') <= 0) | (store.column('age') > 100)
+        
+        # Remove dead agents - highest rows first, so swap-pop never moves a row still to visit
+        for row in np.flatnonzero(dead_mask)[::-1].tolist():
+            agent = self.population[row]
+            self.world.remove_entity(agent)
+            self.metrics['deaths_this_epoch'] += 1
+            self.remove_agent(agent)
+    
+    def _select_actions(self, agents):
+        """Get (state, action) for each (agent, exploration rate) from its Q-table"""
+        choices = []
+        for agent, exploration_rate in agents:
+            state = agent.get_state_representation()
             action = self.q_learning_system.select_action(
                 agent.genome.q_table, 
                 state, 
-                exploration_rate=0.1 / (1 + agent.age/100)
+                exploration_rate=exploration_rate
             )
-            
-            # Execute action and get reward
-            reward = self.execute_action(agent, action)
-            
-            # Get new state
-            new_state = agent.get_state_representation()
-            
-            # Update Q-table
+            choices.append((state, action))
+        return choices
+    
+    def _update_q_tables(self, outcomes):
+        """Apply the Q-learning update for each (agent, state, action, reward, new_state)"""
+        for agent, state, action, reward, new_state in outcomes:
             agent.genome.q_table = self.q_learning_system.update_q_table(
                 agent.genome.q_table,
                 state,
@@ -94,49 +165,40 @@ class Population:
                 new_state,
                 learning_rate=agent.genome.learning_capacity
             )
-            
-            # Age agent and update metrics
-            agent.age += 1
-            agent.energy -= 1.0 * agent.genome.metabolism / agent.genome.stamina  # Base energy consumption
-
-            # Check for death conditions
-            if agent.energy <= 0 or agent.age > 100:
-                agents_to_remove.append(agent)
-                self.world.remove_entity(agent)
+        return []
+    
+    def shutdown(self):
+        """Stop the worker threads, if any were started; a later update starts new ones"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _map_agents(self, fn, items):
+        """Run fn over items, split into one chunk per worker thread when workers > 1"""
+        if self.workers <= 1 or len(items) < 2 * self.workers:
+            return fn(items)
         
-        # Remove dead agents
-        for agent in agents_to_remove:
-            self.metrics['deaths_this_epoch'] += 1
-            self.population.remove(agent)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        
+        # Contiguous chunks keep results in the same order as items
+        size = -(-len(items) // self.workers)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        return [result for chunk in self._executor.map(fn, chunks) for result in chunk]
     
     def execute_action(self, agent, action):
-        """Execute an action for an agent and return the reward"""
-        reward = 0
-        
-        if action == 'eat':
-            # Find food and eat it
-            # Implementation depends on your world structure
-            reward = self.try_eat(agent)
-            
-        elif action == 'work':
-            # Find work and perform it
-            reward = self.try_work(agent)
-            
-        elif action == 'rest':
-            # Rest to regain energy
-            energy_gain = 10 * agent.genome.stamina
-            agent.energy = min(100, agent.energy + energy_gain)
-            reward = energy_gain / 20  # Small reward for maintaining energy
-            
-        elif action == 'mate':
-            # Find mate and attempt reproduction
-            reward = self.try_mate(agent)
-            
-        elif action == 'search':
-            # Random movement/exploration
-            reward = self.try_search(agent)
-            
-        return reward
+        """Execute an Action for an agent and return the reward"""
+        return _ACTION_HANDLERS[action](self, agent)
+    
+    def try_rest(self, agent):
+        """Rest to regain energy"""
+        energy_gain = 10 * agent.genome.stamina
+        agent.energy = min(100, agent.energy + energy_gain)
+        return energy_gain / 20  # Small reward for maintaining energy
+    
+    def no_reward(self, agent):
+        """Actions the population doesn't act out yet earn nothing"""
+        return 0
     
     def try_eat(self, agent):
         """Try to find and eat food"""
@@ -152,9 +214,12 @@ class Population:
         if not workplaces:
             return 0  # No workplaces found
         
+        # Bind the lookup once and use the pre-registered component IDs
+        get_component = self.world.ecs.get_component
+        
         # Choose the first available workplace
         for workplace_id in workplaces:
-            workplace_comp = self.world.ecs.get_component(workplace_id, "workplace")
+            workplace_comp = get_component(workplace_id, ComponentID.WORKPLACE)
             
             if workplace_comp and len(workplace_comp.workers) < workplace_comp.max_workers:
                 # Add agent as worker
@@ -163,7 +228,7 @@ class Population:
                     agent.current_action = "work"
                     
                     # Pay the agent based on base wage and work session duration
-                    wallet_comp = self.world.ecs.get_component(agent.ecs_id, "wallet")
+                    wallet_comp = get_component(agent.ecs_id, ComponentID.WALLET)
                     if wallet_comp:
                         earned = workplace_comp.base_wage * 0.1  # Small amount per work session
                         wallet_comp.add_money(earned)
@@ -197,7 +262,7 @@ class Population:
             
             # Occasionally spawn new resources
             if step % 20 == 0:
-                self.world.create_food()
+                self.world.create_farms()
                 
             if step % 50 == 0:
                 self.world.create_work()
@@ -240,15 +305,22 @@ class Population:
         
         self.create_resources()
 
-        # Update society's population reference
-        self.population = new_population
+        # Update society's population
+        self.clear_agents()
+        for agent in new_population:
+            self.add_agent(agent)
         
         print(f"Epoch {self.epoch} started with {len(self.population)} agents")
 
     def create_resources(self):
-        # Create new resources
-        for _ in range(self.world.food_count):
-            self.world.create_food()
-        
-        for _ in range(self.world.work_count):
-            self.world.create_work()        
\ No newline at end of file
+        # Top up resources - each call spawns its whole shortfall at once
+        self.world.create_farms(self.world.farm_count)
+        self.world.create_work(self.world.work_count)        
+
+# Action handlers indexed by Action ID, so execute_action is a single list lookup
+_ACTION_HANDLERS = [Population.no_reward] * len(Action)
+_ACTION_HANDLERS[Action.EAT] = Population.try_eat
+_ACTION_HANDLERS[Action.WORK] = Population.try_work
+_ACTION_HANDLERS[Action.REST] = Population.try_rest
+_ACTION_HANDLERS[Action.MATE] = Population.try_mate
+_ACTION_HANDLERS[Action.SEARCH] = Population.try_search
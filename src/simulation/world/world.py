@@ -1,7 +1,7 @@
 from src.simulation.entities.types.farm import Farm
 from src.simulation.entities.types.workplace import WorkPlace
-from src.simulation.entities.types.agent import Agent
-from src.core.ecs.core import ECS
+from src.simulation.entities.types.agent import Agent, METRIC_FIELDS, METRIC_ACTIONS
+from src.core.ecs.core import ECS, ComponentStore, entity_slot
 from src.core.ecs.components.render import RenderComponent
 from src.core.ecs.components.animation import AnimationComponent
 from src.core.ecs.components.transform import TransformComponent
@@ -22,23 +22,34 @@ from src.core.ecs.systems.navigation import NavigationSystem
 from src.data.metrics import MetricsCollector
 from src.core.ecs.components.workplace import WorkplaceComponent
 from src.core.ecs.components.wallet import WalletComponent
-import random
+from collections import defaultdict
+import numpy as np
 
 class World:
     def __init__(self, width, height):
         self.width = width
         self.height = height
         self.entities = []
+        self._entity_by_ecs_id = []  # Reverse index for get_entity_by_id, by dense ECS slot
         self.population_size = 100
         self.farm_count = 25
         self.work_count = 15
         self.world_screen = None  # Will be set by Simulation
         
+        # Entities bucketed by EntityType, kept in step with the entity list
+        self.entities_by_type = defaultdict(list)
+        
+        # Age, vitals, current action and energy decay of every population agent, column-wise
+        self.agent_metrics = ComponentStore(METRIC_FIELDS, capacity=self.population_size * 4)
+        
         # Initialize metrics collector
         self.metrics = MetricsCollector()
         
-        # Initialize ECS world
-        self.ecs = ECS()
+        # Spare room for births on top of the starting population and resources
+        self.capacity = (self.population_size + self.farm_count + self.work_count) * 4
+        
+        # Initialize ECS world, with component stores sized for every entity up front
+        self.ecs = ECS(store_capacity=self.capacity)
         
         # Initialize spatial grid
         self.spatial_grid = SpatialGrid(width, height)
@@ -85,95 +96,128 @@ class World:
     def setup_world(self):
         # Setup ECS systems first
         self.setup_systems()
+        self.preallocate_pools()
         
         # Create entities
         self.create_population()
         self.create_farms()
         self.create_work()
         
+    def preallocate_pools(self):
+        """Fill the farm and workplace pools so spawning reuses ready-made entities
+        
+        Agents are not preallocated - they have no reset(), so the pool can't reissue them.
+        """
+        self.entity_pools[Farm].preallocate(self.farm_count, self.world_screen)
+        self.entity_pools[WorkPlace].preallocate(self.work_count, self.world_screen)
+        
+    def random_positions(self, count):
+        """Draw count uniform (x, y) positions inside the world, both bounds inclusive"""
+        xs = np.random.randint(0, self.width + 1, size=count)
+        ys = np.random.randint(0, self.height + 1, size=count)
+        return list(zip(xs.tolist(), ys.tolist()))
+        
     def create_population(self):
-        for i in range(self.population_size):
+        positions = self.random_positions(self.population_size)
+        for i, position in enumerate(positions):
             agent = self.entity_factory.create_entity(
                 EntityType.PERSON_MALE if i % 2 == 0 else EntityType.PERSON_FEMALE, 
-                (random.randint(0, self.width), random.randint(0, self.height)),
+                position,
                 self.world_screen,
                 id=i
             )
-            self.entities.append(agent)
-            self.society.population.append(agent)
+            self.track_entity(agent)
+            self.society.add_agent(agent)
 
-    def create_farms(self):
+    def create_farms(self, target_count=None):
+        """Top the farms up to target_count (default farm_count) in one batch"""
+        if target_count is None:
+            target_count = self.farm_count
+        
         # Only create food if we don't have enough
-        current_farm_count = sum(1 for e in self.entities if e.entity_type == EntityType.FARM)
-        for i in range(current_farm_count, self.farm_count):
+        for position in self.random_positions(max(0, target_count - len(self.entities_by_type[EntityType.FARM]))):
             food = self.entity_factory.create_entity(
                 EntityType.FARM,
-                (random.randint(0, self.width), random.randint(0, self.height)),
+                position,
                 self.world_screen
             )
-            self.entities.append(food)
+            self.track_entity(food)
 
-    def create_work(self):
+    def create_work(self, target_count=None):
+        """Top the workplaces up to target_count (default work_count) in one batch"""
+        if target_count is None:
+            target_count = self.work_count
+        
         # Only create workplaces if we don't have enough
-        current_work_count = sum(1 for e in self.entities if e.entity_type == EntityType.WORK)
-        for i in range(current_work_count, self.work_count):
+        for position in self.random_positions(max(0, target_count - len(self.entities_by_type[EntityType.WORK]))):
             workplace = self.entity_factory.create_entity(
                 EntityType.WORK,
-                (random.randint(0, self.width), random.randint(0, self.height)),
+                position,
                 self.world_screen
             )
-            self.entities.append(workplace)
-        
-    def add_entity(self, entity):
+            self.track_entity(workplace)
+    
+    def track_entity(self, entity):
+        """Add an entity that already has its ECS components to the entity list"""
+        entity._world_idx = len(self.entities)
         self.entities.append(entity)
+        index = self._entity_by_ecs_id
+        slot = entity_slot(entity.ecs_id)
+        if slot >= len(index):
+            index.extend([None] * (slot + 1 - len(index)))
+        index[slot] = entity
+        bucket = self.entities_by_type[entity.entity_type]
+        entity._type_idx = len(bucket)
+        bucket.append(entity)
+    
+    def untrack_entity(self, entity):
+        """Remove an entity from the entity list by swapping the last entity into its slot"""
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[entity._world_idx] = last
+            last._world_idx = entity._world_idx
+        self._entity_by_ecs_id[entity_slot(entity.ecs_id)] = None
+        
+        # Same swap-pop within the entity's type bucket
+        bucket = self.entities_by_type[entity.entity_type]
+        last = bucket.pop()
+        if last is not entity:
+            bucket[entity._type_idx] = last
+            last._type_idx = entity._type_idx
         
-        # Create an ECS entity and add components
+    def add_entity(self, entity):
+        # Create an ECS entity
         entity_id = self.ecs.create_entity()
         
         # Store ECS entity ID with the entity
         entity.ecs_id = entity_id
         entity.world = self  # Add reference to world
+        self.track_entity(entity)
         
-        # Add transform component
-        self.ecs.add_component(
-            entity_id,
-            "transform",
-            TransformComponent(entity_id, position=entity.position)
-        )
+        # Collect every component first, then attach them in one ECS call
+        components = {}
         
-        # Add entity to spatial grid
-        self.spatial_grid.insert(entity_id, entity.position[0], entity.position[1])
+        # Add transform component
+        components["transform"] = TransformComponent(entity_id, position=entity.position)
         
         # Add tag component based on entity type
         tag_value = None
         if hasattr(entity, 'genome'):
             tag_value = "agent"
             # Add wallet component for agents
-            self.ecs.add_component(
-                entity_id,
-                "wallet",
-                WalletComponent(entity_id, money=entity.money)
-            )
+            components["wallet"] = WalletComponent(entity_id, money=entity.money)
         elif entity.entity_type == EntityType.FARM:
             tag_value = "farm"
         elif entity.entity_type == EntityType.WORK:
             tag_value = "work"
             # Add workplace component for workplaces
-            self.ecs.add_component(
+            components["workplace"] = WorkplaceComponent(
                 entity_id,
-                "workplace",
-                WorkplaceComponent(
-                    entity_id,
-                    max_workers=entity.capacity
-                )
+                max_workers=entity.capacity
             )
         
         if tag_value:
-            self.ecs.add_component(
-                entity_id,
-                "tag",
-                TagComponent(entity_id, tag=tag_value)
-            )
+            components["tag"] = TagComponent(entity_id, tag=tag_value)
         
         # Add render component for main asset
         render_component = RenderComponent(
@@ -188,43 +232,42 @@ class World:
             if name != entity.entity_type.value:
                 render_component.add_asset_for_state(name, asset)
         
-        self.ecs.add_component(entity_id, "render", render_component)
+        components["render"] = render_component
         
         # Add animation components if any
         for name, asset in entity.assets.items():
             if hasattr(asset, 'update'):
-                self.ecs.add_component(
+                components["animation"] = AnimationComponent(
                     entity_id,
-                    "animation",
-                    AnimationComponent(
-                        entity_id,
-                        asset,
-                        position=entity.position,
-                        name=name
-                    )
+                    asset,
+                    position=entity.position,
+                    name=name
                 )
         
         # Add behavior component for agents
         if hasattr(entity, 'genome'):
-            self.ecs.add_component(
+            components["behavior"] = BehaviorComponent(
                 entity_id,
-                "behavior",
-                BehaviorComponent(
-                    entity_id,
-                    state="idle",
-                    properties={
-                        "energy": entity.energy,
-                        "money": entity.money,
-                        "mood": entity.mood
-                    }
-                )
+                state="idle",
+                properties={
+                    "energy": entity.energy,
+                    "money": entity.money,
+                    "mood": entity.mood
+                }
             )
+        
+        self.ecs.add_components(entity_id, components)
+        
+        # Add entity to spatial grid (and its tag's grid)
+        self.spatial_grid.insert(entity_id, entity.position[0], entity.position[1], tag_value)
 
     def remove_entity(self, entity):
         # For dead agents, don't remove from entities list immediately
         # This allows them to still be rendered with their "dead" state
-        if entity in self.entities and (not hasattr(entity, 'is_alive') or entity.is_alive):
-            self.entities.remove(entity)
+        ecs_id = getattr(entity, 'ecs_id', None)
+        tracked = ecs_id is not None and self.get_entity_by_id(ecs_id) is entity
+        if tracked and (not hasattr(entity, 'is_alive') or entity.is_alive):
+            self.untrack_entity(entity)
             
             # Remove from spatial grid
             self.spatial_grid.remove(entity.ecs_id)
@@ -237,6 +280,11 @@ class World:
             if entity_type in self.entity_pools:
                 self.entity_pools[entity_type].release(entity)
 
+    def shutdown(self):
+        """Release the worker threads held by the society and the ECS"""
+        self.society.shutdown()
+        self.ecs.shutdown()
+
     def update_world(self):
         # Update the ECS world instead of individual entities
         self.ecs.update(1.0)  # Using 1.0 as a fixed delta time
@@ -246,81 +294,84 @@ class World:
 
     def collect_metrics(self):
         """Collect current world state metrics"""
-        # Count males and females
-        males = sum(1 for agent in self.society.population if agent.genome.gender.value == 'male')
-        females = len(self.society.population) - males
+        # Population values are stored column-wise, so each summary is one reduction
+        store = self.agent_metrics
+        count = store.count
+        
+        # Count males and females - the population keeps a running male count
+        males = self.society.male_count
+        females = count - males
         
         # Calculate agent averages
         avg_age = avg_energy = avg_money = avg_mood = 0
-        if self.society.population:
-            avg_age = sum(agent.age for agent in self.society.population) / len(self.society.population)
-            avg_energy = sum(agent.energy for agent in self.society.population) / len(self.society.population)
-            avg_money = sum(agent.money for agent in self.society.population) / len(self.society.population)
-            avg_mood = sum(agent.mood for agent in self.society.population) / len(self.society.population)
+        if count:
+            avg_age = float(store.column('age').mean())
+            avg_energy = float(store.column('energy').mean())
+            avg_money = float(store.column('money').mean())
+            avg_mood = float(store.column('mood').mean())
             
-        # Count actions
-        action_counts = {'eat': 0, 'work': 0, 'rest': 0, 'mate': 0, 'search': 0}
-        for agent in self.society.population:
-            if agent.current_action and agent.current_action in action_counts:
-                action_counts[agent.current_action] += 1
+        # Count actions - the extra last bin collects every other action
+        action_counts = np.bincount(store.column('action'), minlength=len(METRIC_ACTIONS) + 1).tolist()
                 
         # Update metrics collector
         self.metrics.collect({
-            'population_size': len([agent for agent in self.society.population if agent.is_alive]),
+            'population_size': int(np.count_nonzero(store.column('alive'))),
             'male_count': males,
             'female_count': females,
-            'farm_count': sum(1 for e in self.entities if e.entity_type == EntityType.FARM),
-            'work_count': sum(1 for e in self.entities if e.entity_type == EntityType.WORK),
+            'farm_count': len(self.entities_by_type[EntityType.FARM]),
+            'work_count': len(self.entities_by_type[EntityType.WORK]),
             'avg_age': avg_age,
             'avg_energy': avg_energy,
             'avg_money': avg_money,
             'avg_mood': avg_mood,
-            'action_eat': action_counts['eat'],
-            'action_work': action_counts['work'],
-            'action_rest': action_counts['rest'],
-            'action_mate': action_counts['mate'],
-            'action_search': action_counts['search'],
+            'action_eat': action_counts[0],
+            'action_work': action_counts[1],
+            'action_rest': action_counts[2],
+            'action_mate': action_counts[3],
+            'action_search': action_counts[4],
             'epoch': self.society.epoch
         })
 
     def get_entity_by_id(self, entity_id):
         """Find an entity by its ECS ID"""
-        for entity in self.entities:
-            if hasattr(entity, 'ecs_id') and entity.ecs_id == entity_id:
+        if entity_id is None or entity_id < 0:
+            return None
+        
+        # Equal non-int keys (e.g. 1.0) matched the old dict index, so they still do
+        if type(entity_id) is not int:
+            if entity_id != int(entity_id):
+                return None
+            entity_id = int(entity_id)
+        
+        # The slot may since hold a newer entity - only an exact ID match counts
+        slot = entity_slot(entity_id)
+        if slot < len(self._entity_by_ecs_id):
+            entity = self._entity_by_ecs_id[slot]
+            if entity is not None and entity.ecs_id == entity_id:
                 return entity
         return None
 
     def reset_world(self):
         """Reset the world state between epochs"""
-        # Clear all entities from the world
-        entities_to_remove = self.entities.copy()
-        for entity in entities_to_remove:
-            # Force removal of all entities including dead ones
-            if entity in self.entities:
-                self.entities.remove(entity)
-                
-                # Remove from spatial grid if it has an ECS ID
-                if hasattr(entity, 'ecs_id'):
-                    self.spatial_grid.remove(entity.ecs_id)
-                    
-                    # Return to pool
-                    entity_type = type(entity)
-                    if entity_type in self.entity_pools:
-                        self.entity_pools[entity_type].release(entity)
-        
-        # Reset the ECS world
-        self.ecs = ECS()
+        # Return all entities, including dead ones, to their pools - the list
+        # itself is dropped below
+        for entity in self.entities:
+            entity_type = type(entity)
+            if entity_type in self.entity_pools:
+                self.entity_pools[entity_type].release(entity)
         
-        # Reset spatial grid
-        self.spatial_grid = SpatialGrid(self.width, self.height)
+        # Empty the ECS world and spatial grid in place; systems and the entity
+        # factory keep their references, so they need no re-setup
+        self.ecs.clear()
+        self.spatial_grid.clear()
         
         # Reset entity lists
         self.entities = []
-        self.society.population = []
+        self._entity_by_ecs_id.clear()
+        self.entities_by_type.clear()
+        self.society.clear_agents()
         
         # Reset entity pools
         for pool in self.entity_pools.values():
             pool.clear()
-        
-        # Re-setup systems with the new ECS world
-        self.setup_systems()
\ No newline at end of file
+        self.preallocate_pools()
\ No newline at end of file
@@ -1,6 +1,10 @@
 import pygame
 from typing import Dict, List, Tuple, Set
 from collections import defaultdict
+from src.core.assets.manager import AssetManager
+
+# Surface.fblits (pygame-ce 2.1.4+) skips building a return list and per-item source rects
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
 
 class RenderManager:
     """Manages optimized rendering with sprite batching and dirty rectangles"""
@@ -12,21 +16,32 @@ class RenderManager:
         self.height = screen.get_height()
         self.world = None
 
-        # For sprite batching - group by texture
-        self.batches = defaultdict(list)
+        # For sprite batching - group by texture, then by source rect so each
+        # inner group is one blits call with a fixed source area
+        self.batches = defaultdict(lambda: defaultdict(list))
         
         # For dirty rectangle rendering
         self.dirty_rects = []
         self.prev_entity_rects = {}  # Track previous frame entity positions
         
+        # Images known to have no transparent pixels, registered by the asset manager on load
+        self._opaque_textures = AssetManager().opaque_images
+        
         # For viewport culling
         self.view_rect = pygame.Rect(0, 0, self.width, self.height)
         
-        # UI rectangles to avoid overwriting
+        # UI rectangles to avoid overwriting, plus their merged union for fast tests
         self.ui_rects = ui_rects or []
+        self._ui_union_rects = self._merge_rectangles(self.ui_rects, max_rects=0)
         
-        # Create background surface once
+        # Create background surface once, converted to the display format so
+        # refills don't pay a per-blit pixel conversion
         self.background = self.create_background()
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+        
+        # Refill the dirty rects' bounding box in one blit above this many regions
+        self.bbox_refill_threshold = 8
         
         # Track if this is the first frame
         self.first_frame = True
@@ -47,11 +62,13 @@ class RenderManager:
     def add_ui_rect(self, rect):
         """Add a UI rectangle to avoid drawing over"""
         self.ui_rects.append(rect)
+        self._ui_union_rects = self._merge_rectangles(self.ui_rects, max_rects=0)
     
     def remove_ui_rect(self, rect):
         """Remove a UI rectangle"""
         if rect in self.ui_rects:
             self.ui_rects.remove(rect)
+            self._ui_union_rects = self._merge_rectangles(self.ui_rects, max_rects=0)
     
     def add_to_batch(self, texture_id, position, source_rect=None, dest_rect=None):
         """Add sprite to appropriate batch based on texture"""
@@ -65,25 +82,33 @@ class RenderManager:
             return
         
         # Skip if inside a UI rectangle
-        for ui_rect in self.ui_rects:
-            if ui_rect.colliderect(dest_rect):
-                return
+        if dest_rect.collidelist(self._ui_union_rects) != -1:
+            return
             
-        # Add to appropriate batch - make a copy of the rect to avoid modification issues
-        dest_rect_copy = dest_rect.copy()
-        self.batches[texture_id].append((source_rect, dest_rect_copy))
+        # Add to appropriate batch - copy the rect to avoid modification issues
+        batch_rect = dest_rect.copy()
+        source_key = tuple(source_rect) if source_rect is not None else None
+        self.batches[texture_id][source_key].append(batch_rect)
+        
+        # An unmoved opaque sprite redraws over its own pixels, so the background
+        # under it needs no refill
+        prev_rect = self.prev_entity_rects.get(texture_id)
+        if prev_rect is not None and prev_rect == dest_rect:
+            texture = texture_id[0] if isinstance(texture_id, tuple) else texture_id
+            if texture in self._opaque_textures:
+                return
         
-        # Mark area as dirty - also make a copy of the rect
-        self.dirty_rects.append(dest_rect_copy)
+        # Mark area as dirty - the batch rect is only read this frame, so share it
+        self.dirty_rects.append(batch_rect)
         
-        # If entity existed before, mark its previous position as dirty too
-        if texture_id in self.prev_entity_rects:
-            prev_rect = self.prev_entity_rects[texture_id]
+        # If entity existed before, mark its previous position as dirty too, then
+        # store the current position for next frame in the same persistent rect
+        if prev_rect is not None:
             self.dirty_rects.append(prev_rect.copy())
-        
-        # Store current position for next frame - make a new copy to avoid reference issues
-        self.prev_entity_rects[texture_id] = dest_rect.copy()
-        
+            prev_rect.update(dest_rect)
+        else:
+            self.prev_entity_rects[texture_id] = dest_rect.copy()
+    
     def clear(self):
         """Reset batches for new frame"""
         self.batches.clear()
@@ -100,8 +125,14 @@ class RenderManager:
             # Redraw background in dirty areas
             if self.dirty_rects:
                 merged_rects = self._merge_rectangles(self.dirty_rects)
-                for rect in merged_rects:
-                    self.screen.blit(self.background, rect, rect)
+                
+                # Many regions - refill their bounding box with one blit, trading
+                # some overdraw for fewer SDL calls
+                if len(merged_rects) > self.bbox_refill_threshold:
+                    bbox = merged_rects[0].unionall(merged_rects[1:])
+                    self.screen.blit(self.background, bbox, bbox)
+                else:
+                    self.screen.blits([(self.background, rect, rect) for rect in merged_rects], doreturn=False)
         
         # Sort batches by entity tag type (dead agents first, then food/work, then living agents)
         # This ensures proper rendering order (dead agents on bottom, living ones on top)
@@ -128,41 +159,63 @@ class RenderManager:
             # Fallback to simple entity ID sorting
             sorted_batches = sorted(self.batches.items(), key=lambda x: x[0][1] if isinstance(x[0], tuple) and len(x[0]) > 1 else 0)
         
-        # Render each batch (grouped by texture)
-        for texture_id, draw_info in sorted_batches:
+        # Render each batch (grouped by texture, then by source rect)
+        for texture_id, source_groups in sorted_batches:
             # Get the texture
             texture = texture_id[0] if isinstance(texture_id, tuple) else texture_id
             
-            # Use more efficient blits for multiple sprites with same texture
-            if len(draw_info) > 1:
-                self.screen.blits([(texture, dest_rect, source_rect) 
-                                 for source_rect, dest_rect in draw_info])
-            elif draw_info:
-                source_rect, dest_rect = draw_info[0]
-                self.screen.blit(texture, dest_rect, source_rect)
+            # Use more efficient blits for multiple sprites with same texture and source
+            for source_rect, dest_rects in source_groups.items():
+                if len(dest_rects) > 1:
+                    if HAS_FBLITS and source_rect is None:
+                        self.screen.fblits([(texture, dest_rect) for dest_rect in dest_rects])
+                    else:
+                        self.screen.blits([(texture, dest_rect, source_rect)
+                                         for dest_rect in dest_rects], doreturn=False)
+                else:
+                    self.screen.blit(texture, dest_rects[0], source_rect)
         
         # Reset dirty rects for next frame
         self.dirty_rects = []
         
-    def _merge_rectangles(self, rects, max_rects=10):
-        """Merge overlapping rectangles to minimize redraw operations"""
+    def _merge_rectangles(self, rects, max_rects=10, max_merged=100):
+        """Merge overlapping rectangles to minimize redraw operations
+        
+        Sweeps the rectangles in order of their left edge, so each one is only
+        tested against the merged rectangles still overlapping it horizontally.
+        """
         if not rects:
             return []
             
-        # Start with a copy of the input rectangles
-        result = [rect.copy() for rect in rects]
-        
-        # Simple greedy algorithm to merge rectangles
-        i = 0
-        while i < len(result) - 1 and len(result) > max_rects:
-            j = i + 1
-            while j < len(result):
-                if result[i].colliderect(result[j]):
-                    # Merge these rectangles
-                    result[i].union_ip(result[j])
-                    result.pop(j)
-                else:
-                    j += 1
-            i += 1
+        # Few enough rectangles - redraw them as they are
+        if len(rects) <= max_rects:
+            return [rect.copy() for rect in rects]
+        
+        merged = []
+        active = []
+        for rect in sorted(rects, key=lambda r: r.left):
+            current = rect.copy()
+            
+            # Retire rectangles ending before this one starts, along with absorbed ones
+            active = [a for a in active if a.width and a.right >= current.left]
+            
+            # Absorb every active rectangle we overlap. Absorbed rectangles are emptied
+            # as tombstones - an empty rect never collides - and the grown union is
+            # tested against the active set again until it stops picking up more.
+            hits = current.collidelistall(active)
+            while hits:
+                for k in hits:
+                    current.union_ip(active[k])
+                    active[k].width = 0
+                hits = current.collidelistall(active)
+                
+            active.append(current)
+            merged.append(current)
+            
+        result = [rect for rect in merged if rect.width]
+        
+        # Too many disjoint regions - a single bounding box is cheaper to refill
+        if len(result) > max_merged:
+            return [result[0].unionall(result[1:])]
             
         return result
@@ -22,6 +22,11 @@ class EntityPool:
         self.active.append(entity)  # Using append instead of add
         return entity
         
+    def preallocate(self, count, *args, **kwargs):
+        """Create entities up front until count are available for acquire()"""
+        for _ in range(count - len(self.available)):
+            self.available.append(self.entity_class(*args, **kwargs))
+        
     def release(self, entity):
         """Return an entity to the pool"""
         if entity in self.active: